@@ -1921,6 +1921,7 @@ def _scraping_worker(shared, selected_banks, scrape_type, auto_zip, download_fil
         else:
             shared['logs'] = msgs.copy()
 
+    scraper = None
     try:
         config = Config(scrape_type, output_dir=save_path if save_path else None)
         logger = StreamlitLogger()
@@ -2047,7 +2048,8 @@ def _scraping_worker(shared, selected_banks, scrape_type, auto_zip, download_fil
         shared['results'] = results
         shared['bank_dates'] = bank_dates
 
-        # Chrome 사용 구간 종료 — Thread B에 Chrome 해제 알림
+        # Chrome 사용 구간 종료 — 재사용하던 드라이버 종료 후 Thread B에 Chrome 해제 알림
+        scraper.close()
         shared['chrome_phase_done'] = True
 
         # ZIP 압축
@@ -2132,6 +2134,8 @@ def _scraping_worker(shared, selected_banks, scrape_type, auto_zip, download_fil
         progress['phase'] = 'error'
 
     finally:
+        if scraper is not None:
+            scraper.close()
         shared['chrome_phase_done'] = True   # Thread B 대기 해제 (에러 시에도)
         shared['scraping_running'] = False
 
@@ -2357,10 +2361,14 @@ def _disclosure_worker(shared, save_path=None, selected_banks=None, api_key=None
                 f"저축은행_공시파일_{datetime.now().strftime('%Y%m%d')}.zip"
             )
             files_added = 0
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
                 for fpath in downloaded_files:
                     if os.path.isfile(fpath) and not fpath.endswith('.zip'):
-                        zipf.write(fpath, os.path.basename(fpath))
+                        # PDF/XLSX는 이미 압축된 형식이므로 재압축 없이 저장
+                        compress_type = (zipfile.ZIP_STORED
+                                         if fpath.lower().endswith(('.pdf', '.xlsx'))
+                                         else zipfile.ZIP_DEFLATED)
+                        zipf.write(fpath, os.path.basename(fpath), compress_type=compress_type)
                         files_added += 1
             if files_added > 0 and os.path.getsize(zip_path) > 0:
                 shared['zip_path'] = zip_path
@@ -0,0 +1,20 @@
+"""
+엑셀 저장 공용 함수 (Streamlit 스크래퍼와 로컬 데스크톱 스크래퍼에서 함께 사용)
+"""
+
+
+def write_sheet(writer, df, sheet_name):
+    """DataFrame을 시트에 기록합니다.
+
+    xlsxwriter 엔진이면 pandas ExcelFormatter(컬럼 단위로 셀마다 서식 객체 생성)를 거치지 않고
+    헤더와 행을 write_row로 위에서 아래로 씁니다. 그래서 constant_memory 모드에서도 안전합니다.
+    결측값은 빈 셀로 둡니다. 다른 엔진이면 to_excel을 그대로 사용합니다.
+    """
+    if writer.engine != 'xlsxwriter':
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    ws = writer.book.add_worksheet(sheet_name)
+    ws.write_row(0, 0, [str(c) for c in df.columns])
+    values = df.astype(object).where(df.notna(), None).to_numpy()
+    for r, row in enumerate(values, start=1):
+        ws.write_row(r, 0, row.tolist())
@@ -47,12 +47,263 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+try:
+    import lxml  # noqa: F401  (C 파서 사용 가능 여부 확인)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+try:
+    import xlsxwriter  # noqa: F401  (스트리밍 엑셀 저장)
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 import warnings
+
+# 상위 디렉토리를 경로에 추가 (excel_utils 임포트용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from excel_utils import write_sheet
+
 warnings.filterwarnings("ignore", category=DeprecationWarning)  # 웹드라이버 관련 경고 무시
 warnings.filterwarnings("ignore", category=UserWarning)  # 기타 경고 무시
 
+# create_driver: CDP로 차단할 하위 리소스 URL 패턴 (CSS는 innerText 가시성 판정에 필요해 유지)
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics*', '*googletagmanager*',
+]
+
+# BeautifulSoup 폴백에서 테이블만 파싱하기 위한 필터
+_TABLE_STRAINER = SoupStrainer('table')
+
+# 이미 압축된 형식이라 ZIP에 다시 deflate해도 크기 이득이 없는 확장자
+_PRECOMPRESSED_EXTS = ('.xlsx', '.zip', '.pdf')
+
+# 날짜 파싱 정규식 (모듈 로드 시 한 번만 컴파일, 월말이 없는 경우도 포함)
+_DATE_RE = re.compile(r'\d{4}년\d{1,2}월말?')
+
+# XPath 2개에 해당하는 요소들의 화면 표시 텍스트를 한 번의 execute_script로 수집
+# (Selenium element.text와 같이 화면에 보이지 않는 요소는 제외)
+_COLLECT_DATE_TEXTS_JS = """
+function collect(xpath) {
+    var snap = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var texts = [];
+    for (var i = 0; i < snap.snapshotLength; i++) {
+        var el = snap.snapshotItem(i);
+        if (el.getClientRects().length === 0) continue;
+        var t = el.innerText;
+        if (t) texts.push(t);
+    }
+    return texts;
+}
+return [collect(arguments[0]), collect(arguments[1])];
+"""
+
+# 요소가 화면에 보이면(선택적으로 태그/텍스트 조건 충족 시) 스크롤 후 클릭
+# arguments[0] = 요소, arguments[1] = 허용 태그 목록(소문자) 또는 null, arguments[2] = 포함해야 할 텍스트 또는 null
+# (is_displayed/tag_name/text를 각각 왕복 호출하지 않고 브라우저에서 한 번에 판정)
+_CLICK_IF_VISIBLE_JS = """
+var el = arguments[0], tags = arguments[1], text = arguments[2];
+if (el.getClientRects().length === 0) return false;
+if (tags && tags.indexOf(el.tagName.toLowerCase()) === -1) return false;
+if (text && !el.innerText.includes(text)) return false;
+el.scrollIntoView({block: 'center'});
+el.click();
+return true;
+"""
+
+# arguments[0] = XPath 목록 — 순서대로 평가해 처음 보이는 요소를 스크롤 후 클릭
+_CLICK_FIRST_VISIBLE_XPATH_JS = """
+var xpaths = arguments[0];
+for (var x = 0; x < xpaths.length; x++) {
+    var snap = document.evaluate(xpaths[x], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < snap.snapshotLength; i++) {
+        var el = snap.snapshotItem(i);
+        if (el.getClientRects().length === 0) continue;
+        try {
+            el.scrollIntoView({block: 'center'});
+            el.click();
+            return true;
+        } catch (e) {
+            continue;
+        }
+    }
+}
+return false;
+"""
+
+# select_category 방법 2: 텍스트 일치 → 탭 컨테이너 내 텍스트/인덱스 → 포함 문자열 순으로 탭 클릭
+# (arguments[0]=카테고리명, arguments[1]=탭 인덱스 — 카테고리마다 스크립트를 다시 만들지 않음)
+_SELECT_CATEGORY_TAB_JS = """
+var category = arguments[0];
+var idx = arguments[1];
+// 모든 탭 관련 요소 찾기
+var tabContainers = document.querySelectorAll('ul.tabs, div.tab-container, nav, .tab-list, ul, div[role="tablist"]');
+
+// 정확한 텍스트 매칭
+var allElements = document.querySelectorAll('a, button, span, li, div');
+for (var k = 0; k < allElements.length; k++) {
+    if (allElements[k].innerText.trim() === category) {
+        allElements[k].scrollIntoView({block: 'center'});
+        allElements[k].click();
+        return "exact_match";
+    }
+}
+
+// 탭 컨테이너에서 인덱스 기반 검색
+for (var i = 0; i < tabContainers.length; i++) {
+    var tabs = tabContainers[i].querySelectorAll('a, li, button, div[role="tab"], span');
+
+    // 먼저 텍스트로 찾기
+    for (var j = 0; j < tabs.length; j++) {
+        if (tabs[j].innerText.includes(category)) {
+            tabs[j].scrollIntoView({block: 'center'});
+            tabs[j].click();
+            return "text_match_in_container";
+        }
+    }
+
+    // 인덱스로 찾기
+    if (tabs.length >= idx + 1) {
+        tabs[idx].scrollIntoView({block: 'center'});
+        tabs[idx].click();
+        return "index_match";
+    }
+}
+
+// 모든 클릭 가능 요소에서 포함 문자열 검색
+var clickables = document.querySelectorAll('a, button, span, div, li');
+for (var j = 0; j < clickables.length; j++) {
+    if (clickables[j].innerText.includes(category)) {
+        clickables[j].scrollIntoView({block: 'center'});
+        clickables[j].click();
+        return "contains_match";
+    }
+}
+
+return false;
+"""
+
+# 카테고리별 탭 위치 (방법 2의 인덱스 기반 검색용)
+_CATEGORY_TAB_INDICES = {
+    "영업개황": 0,
+    "재무현황": 1,
+    "손익현황": 2,
+    "기타": 3
+}
+
+# 특수 케이스 처리를 위한 정확한 은행명 목록 (JT친애 추가)
+_EXACT_BANK_NAMES = {
+    "키움": ["키움", "키움저축은행"],
+    "키움YES": ["키움YES", "키움YES저축은행"],
+    "JT": ["JT", "JT저축은행"],
+    "JT친애": ["JT친애", "JT친애저축은행", "친애", "친애저축은행"],  # JT친애 매핑 추가
+    "상상인": ["상상인", "상상인저축은행"],
+    "상상인플러스": ["상상인플러스", "상상인플러스저축은행"],
+    "머스트삼일": ["머스트삼일", "머스트삼일저축은행"]
+}
+
+# select_bank: arguments[0] = 검색 이름 목록, arguments[1] = 은행명
+# 1차: td/a 텍스트 정확히 일치, 2차: td 텍스트 공백 정규화 후 일치 (XPath normalize-space 대체)
+_SELECT_BANK_JS = """
+var targetBankNames = new Set(arguments[0]);
+var bankName = arguments[1];
+
+function excluded(text) {
+    // 키움/키움YES, JT/JT친애 구분을 위한 추가 검증
+    if (bankName === '키움' && text.includes('YES')) return true;
+    if (bankName === 'JT' && text.includes('친애')) return true;
+    return false;
+}
+
+function clickElement(element) {
+    element.scrollIntoView({block: 'center'});
+    // 링크가 있으면 링크 클릭, 없으면 셀 클릭
+    if (element.tagName === 'A') {
+        element.click();
+    } else {
+        var link = element.querySelector('a');
+        (link || element).click();
+    }
+}
+
+var element = Array.prototype.find.call(document.querySelectorAll('td, a'), function(el) {
+    var text = el.textContent.trim();
+    return targetBankNames.has(text) && !excluded(text);
+});
+if (element) {
+    clickElement(element);
+    return "정확한 매칭 성공";
+}
+
+element = Array.prototype.find.call(document.querySelectorAll('td'), function(el) {
+    if (el.offsetParent === null) return false;
+    var text = el.textContent.replace(/\\s+/g, ' ').trim();
+    return targetBankNames.has(text) && !excluded(text);
+});
+if (element) {
+    clickElement(element);
+    return "공백 정규화 매칭 성공";
+}
+
+return false;
+"""
+
+# 화면에 보이는 테이블들의 내용 요약 (탭 전환 후 테이블이 바뀌었는지 판정용, 보이는 테이블이 없으면 null)
+# 전체 페이지 이동이든 AJAX 교체/표시 전환이든 같은 방식으로 판정할 수 있음
+_TABLES_SIGNATURE_JS = """
+var parts = [];
+var tables = document.getElementsByTagName('table');
+for (var i = 0; i < tables.length; i++) {
+    if (tables[i].getClientRects().length === 0) continue;
+    var text = tables[i].innerText;
+    parts.push(text.length + ':' + text.slice(0, 200));
+}
+return parts.length ? parts.join('|') : null;
+"""
+
+# 카테고리 탭이 이미 선택된 상태인지 판정 (arguments[0] = 카테고리명)
+# 텍스트가 일치하는 보이는 요소나 가까운 상위 요소(li까지, 최대 3단계)에 선택 표시(on/active/selected/current 클래스,
+# aria-selected)가 있으면 참 — 은행 선택 직후 기본 탭(주로 영업개황)은 클릭/대기 없이 바로 추출
+_CATEGORY_TAB_ACTIVE_JS = """
+var category = arguments[0];
+var pattern = /(^|\\s)(on|active|selected|current)(\\s|$)/i;
+var candidates = document.querySelectorAll('a, button, span, li');
+for (var k = 0; k < candidates.length; k++) {
+    var el = candidates[k];
+    if (el.innerText.trim() !== category || el.getClientRects().length === 0) continue;
+    for (var node = el, depth = 0; node && depth < 3; node = node.parentElement, depth++) {
+        if (node.getAttribute('aria-selected') === 'true' || pattern.test(node.getAttribute('class') || '')) return true;
+        if (node.tagName === 'LI') break;
+    }
+}
+return false;
+"""
+
+def _flatten_columns(columns):
+    """MultiIndex 컬럼(항상 튜플)을 빈 값/nan 레벨을 빼고 '_'로 결합한 단일 컬럼명 목록으로 변환"""
+    return [
+        '_'.join(p for p in (str(c).strip() for c in col) if p and p.lower() != 'nan') or f"Column_{i+1}"
+        for i, col in enumerate(columns)
+    ]
+
+def _table_fingerprint(df):
+    """중복 테이블 판정용 키 (컬럼 + 행 내용 해시, 문자열 변환 없이 pandas에서 계산)"""
+    return (tuple(df.columns), int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+def _tables_changed(old_signature):
+    """보이는 테이블 요약이 old_signature와 달라지면 참이 되는 대기 조건."""
+    def _condition(driver):
+        try:
+            signature = driver.execute_script(_TABLES_SIGNATURE_JS)
+        except Exception:
+            # 문서 교체 중에는 스크립트가 실패할 수 있음 — 다음 폴링에서 다시 확인
+            return False
+        return signature is not None and signature != old_signature
+    return _condition
+
 # 표준 에러 출력을 억제하는 컨텍스트 매니저
 @contextmanager
 def suppress_stderr():
@@ -388,6 +639,9 @@ class DriverManager:
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-gpu')
             options.add_argument('--window-size=1280,800')
+
+            # DOMContentLoaded 시점에 바로 반환 (이미지/폰트 등 하위 리소스 로드 대기 안 함)
+            options.page_load_strategy = 'eager'
             options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
             
             # 로그 레벨 설정 (경고 숨기기)
@@ -401,10 +655,10 @@ class DriverManager:
             options.add_argument('--disable-notifications')
             options.add_argument('--disable-popup-blocking')
             
-            # 이미지 로딩 활성화 (필요시)
+            # 이미지 로딩 비활성화 (테이블 데이터는 이미지와 무관)
             prefs = {
                 'profile.default_content_setting_values': {
-                    'images': 1,      # 이미지 로딩 활성화 (1=허용)
+                    'images': 2,      # 이미지 로딩 차단 (2=차단)
                     'plugins': 2,     # 플러그인 차단
                     'javascript': 1,  # JavaScript 허용 (필요)
                     'notifications': 2  # 알림 차단
@@ -474,6 +728,16 @@ class DriverManager:
                     raise
             
             driver.set_page_load_timeout(self.config.PAGE_LOAD_TIMEOUT)
+            # 요소 탐색은 즉시 반환 — 대기는 모두 WaitUtils의 명시적 대기로 처리
+            driver.implicitly_wait(0)
+
+            # 이미지/폰트/미디어/트래커 요청은 네트워크 단계에서 차단 (HTML+JS만 로드)
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+            except Exception:
+                pass
+
             return driver
     
     def get_driver(self):
@@ -629,15 +893,33 @@ class WaitUtils:
     
     @staticmethod
     def wait_for_page_load(driver, timeout):
-        """페이지가 완전히 로드될 때까지 대기합니다."""
+        """페이지 DOM이 준비될 때까지 대기합니다. (eager 로딩이므로 interactive도 허용)"""
         try:
             WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
+                lambda d: d.execute_script('return document.readyState') in ('interactive', 'complete')
             )
             return True
         except TimeoutException:
             return False
     
+    @staticmethod
+    def wait_for_condition(driver, condition, timeout=3):
+        """조건이 충족되는 즉시 반환합니다. (시간 초과 시 False)"""
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def wait_for_tab_switch(driver, old_signature, timeout=3):
+        """탭 클릭 후 보이는 테이블이 새 내용으로 바뀔 때까지 대기합니다.
+
+        <html> staleness는 AJAX 탭 전환에서 끝나지 않고, table 존재 확인은 이전 테이블로도 통과하므로
+        클릭 전 테이블 요약(old_signature)과 비교합니다.
+        """
+        WaitUtils.wait_for_condition(driver, _tables_changed(old_signature), timeout)
+
     @staticmethod
     def wait_with_random(min_time=0.3, max_time=0.7):
         """무작위 시간 동안 대기합니다."""
@@ -1016,22 +1298,37 @@ class BankScraper:
         self.logger = logger
         self.driver_manager = driver_manager
         self.progress_manager = progress_manager
+        # 카테고리 탭 XPath는 은행과 무관하므로 한 번만 생성해 모든 은행에서 재사용
+        self._category_xpaths = {
+            category: self._build_category_xpaths(category) for category in config.CATEGORIES
+        }
+    
+    @staticmethod
+    def _build_category_xpaths(category):
+        """카테고리 탭 탐색용 XPath 목록 (정확한 일치 → 관대한 일치 순)"""
+        return [
+            f"//a[normalize-space(text())='{category}']",
+            f"//a[contains(@class, 'tab') and contains(text(), '{category}')]",
+            f"//li[contains(@class, 'tab') and contains(text(), '{category}')]",
+            f"//span[contains(text(), '{category}')]",
+            f"//button[contains(text(), '{category}')]"
+        ]
     
     def extract_date_information(self, driver):
         """웹페이지에서 공시 날짜 정보를 추출합니다. (개선된 버전)"""
         try:
-            # 방법 1: 당기 데이터 우선 찾기
-            current_period_elements = driver.find_elements(
-                By.XPATH, 
-                "//*[contains(text(), '당기') and contains(text(), '년') and contains(text(), '월')]"
+            # 방법 1/2에서 쓸 텍스트를 브라우저에서 한 번에 수집 (요소마다 .text 왕복 호출하지 않음)
+            current_texts, all_texts = driver.execute_script(
+                _COLLECT_DATE_TEXTS_JS,
+                "//*[contains(text(), '당기') and contains(text(), '년') and contains(text(), '월')]",
+                "//*[contains(text(), '년') and contains(text(), '월')]",
             )
-            
-            if current_period_elements:
-                for element in current_period_elements:
-                    text = element.text
+
+            # 방법 1: 당기 데이터 우선 찾기
+            if current_texts:
+                for text in current_texts:
                     # 정규식으로 날짜 패턴 추출
-                    date_pattern = re.compile(r'\d{4}년\d{1,2}월말?')
-                    matches = date_pattern.findall(text)
+                    matches = _DATE_RE.findall(text)
                     
                     if matches:
                         # 가장 최근 연도 찾기
@@ -1040,33 +1337,20 @@ class BankScraper:
                         return latest_date
             
             # 방법 2: 모든 날짜를 찾아서 가장 최근 것 선택
-            all_date_elements = driver.find_elements(
-                By.XPATH, 
-                "//*[contains(text(), '년') and contains(text(), '월')]"
-            )
-            
             all_dates = []
-            for element in all_date_elements:
-                text = element.text
-                # 정규식 패턴 개선 (월말이 없는 경우도 포함)
-                date_pattern = re.compile(r'\d{4}년\d{1,2}월말?')
-                matches = date_pattern.findall(text)
+            for text in all_texts:
+                matches = _DATE_RE.findall(text)
                 all_dates.extend(matches)
             
             if all_dates:
-                # 중복 제거 및 정렬
-                unique_dates = list(set(all_dates))
-                # 연도 기준으로 정렬하여 가장 최근 날짜 선택
-                sorted_dates = sorted(unique_dates, key=lambda x: int(x[:4]), reverse=True)
-                
                 # 2025년 데이터가 있으면 우선 선택
-                for date in sorted_dates:
-                    if "2025년" in date:
-                        self.logger.log_message(f"최신 날짜 선택: {date}", verbose=False)
-                        return date
+                date = next((d for d in all_dates if "2025년" in d), None)
+                if date:
+                    self.logger.log_message(f"최신 날짜 선택: {date}", verbose=False)
+                    return date
                 
-                # 2025년이 없으면 가장 최근 날짜 반환
-                return sorted_dates[0]
+                # 2025년이 없으면 연도 기준 가장 최근 날짜 반환 (정렬 없이 한 번 순회)
+                return max(all_dates, key=lambda x: int(x[:4]))
             
             # 방법 3: JavaScript로 직접 추출 (더 정확함)
             js_script = """
@@ -1082,19 +1366,16 @@ class BankScraper:
             // 모든 날짜 찾아서 최신 것 반환
             var allMatches = allText.match(/\\d{4}년\\d{1,2}월말?/g);
             if (allMatches) {
-                // 연도별로 정렬
-                allMatches.sort(function(a, b) {
-                    return parseInt(b.substr(0, 4)) - parseInt(a.substr(0, 4));
-                });
-                
-                // 2025년 우선
+                // 2025년 우선, 없으면 연도 최댓값 (정렬 없이 한 번 순회)
+                var best = null, bestYear = -1;
                 for (var i = 0; i < allMatches.length; i++) {
                     if (allMatches[i].includes('2025년')) {
                         return allMatches[i];
                     }
+                    var year = parseInt(allMatches[i].substr(0, 4));
+                    if (year > bestYear) { bestYear = year; best = allMatches[i]; }
                 }
-                
-                return allMatches[0];
+                return best;
             }
             
             return '';
@@ -1119,83 +1400,23 @@ class BankScraper:
             
             # 페이지 로딩 완료 대기
             WaitUtils.wait_for_page_load(driver, self.config.PAGE_LOAD_TIMEOUT)
-            WaitUtils.wait_with_random(0.5, 1)
-            
-            # 특수 케이스 처리를 위한 정확한 은행명 목록 (JT친애 추가)
-            exact_bank_names = {
-                "키움": ["키움", "키움저축은행"],
-                "키움YES": ["키움YES", "키움YES저축은행"],
-                "JT": ["JT", "JT저축은행"],
-                "JT친애": ["JT친애", "JT친애저축은행", "친애", "친애저축은행"],  # JT친애 매핑 추가
-                "상상인": ["상상인", "상상인저축은행"],
-                "상상인플러스": ["상상인플러스", "상상인플러스저축은행"],
-                "머스트삼일": ["머스트삼일", "머스트삼일저축은행"]
-            }
             
             # 검색할 은행명 목록 결정
-            search_names = exact_bank_names.get(bank_name, [bank_name, f"{bank_name}저축은행"])
-            
-            # 방법 1: JavaScript로 정확한 은행명 매칭 (개선된 버전)
-            js_script = f"""
-            var targetBankNames = {json.dumps(search_names)};
-            var found = false;
-            
-            // 모든 테이블 셀과 링크를 검사
-            var allElements = document.querySelectorAll('td, a');
-            
-            for(var i = 0; i < allElements.length; i++) {{
-                var element = allElements[i];
-                var elementText = element.textContent.trim();
-                
-                // 정확한 매칭 확인
-                for(var j = 0; j < targetBankNames.length; j++) {{
-                    if(elementText === targetBankNames[j]) {{
-                        // 키움/키움YES, JT/JT친애 구분을 위한 추가 검증
-                        if('{bank_name}' === '키움' && elementText.includes('YES')) {{
-                            continue;  // 키움을 찾는데 키움YES가 나오면 건너뛰기
-                        }}
-                        if('{bank_name}' === 'JT' && elementText.includes('친애')) {{
-                            continue;  // JT를 찾는데 JT친애가 나오면 건너뛰기
-                        }}
-                        
-                        element.scrollIntoView({{block: 'center'}});
-                        
-                        // 링크가 있으면 링크 클릭, 없으면 셀 클릭
-                        if(element.tagName === 'A') {{
-                            element.click();
-                            found = true;
-                            break;
-                        }} else {{
-                            var link = element.querySelector('a');
-                            if(link) {{
-                                link.click();
-                                found = true;
-                                break;
-                            }} else {{
-                                element.click();
-                                found = true;
-                                break;
-                            }}
-                        }}
-                    }}
-                }}
-                if(found) break;
-            }}
-            
-            return found ? "정확한 매칭 성공" : false;
-            """
+            search_names = _EXACT_BANK_NAMES.get(bank_name, [bank_name, f"{bank_name}저축은행"])
+            
+            # 클릭 전 실제 URL 기준으로 전환을 판정 (리다이렉트/파라미터가 붙은 목록 URL이어도 정확)
+            old_url = driver.current_url
             
-            result = driver.execute_script(js_script)
+            # 은행 선택 (고정 스크립트 + 인자 전달, 정확/공백 정규화 매칭을 한 번의 호출로 처리)
+            result = driver.execute_script(_SELECT_BANK_JS, search_names, bank_name)
             if result:
                 self.logger.log_message(f"{bank_name} 은행: {result}", verbose=False)
-                WaitUtils.wait_with_random(1, 1.5)  # 페이지 전환 대기 시간 증가
                 
-                # 페이지 전환 확인
-                current_url = driver.current_url
-                if current_url != self.config.BASE_URL:
-                    return True
+                # 페이지 전환 확인 — URL이 바뀐 뒤 새 문서의 readyState까지 확인
+                if WaitUtils.wait_for_condition(driver, EC.url_changes(old_url), self.config.WAIT_TIMEOUT):
+                    return WaitUtils.wait_for_page_load(driver, self.config.PAGE_LOAD_TIMEOUT)
             
-            # 방법 2: XPath로 정확한 텍스트 매칭 (보완)
+            # 방법 2: XPath로 정확한 텍스트 매칭 (방법 1이 요소를 못 찾았거나 클릭 후 페이지가 바뀌지 않은 경우)
             for search_name in search_names:
                 # 추가 조건으로 더 정확한 매칭
                 if bank_name == "키움":
@@ -1205,22 +1426,14 @@ class BankScraper:
                 else:
                     xpath = f"//td[normalize-space(text())='{search_name}']"
                 
-                bank_elements = driver.find_elements(By.XPATH, xpath)
-                
-                if bank_elements:
-                    for element in bank_elements:
-                        try:
-                            if element.is_displayed():
-                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                WaitUtils.wait_with_random(0.3, 0.5)
-                                driver.execute_script("arguments[0].click();", element)
-                                WaitUtils.wait_with_random(1, 1.5)
-                                
-                                # 페이지 전환 확인
-                                if driver.current_url != self.config.BASE_URL:
-                                    return True
-                        except:
-                            continue
+                for element in driver.find_elements(By.XPATH, xpath):
+                    try:
+                        # 보이는 요소만 스크롤 후 클릭 (is_displayed/스크롤/클릭을 한 번의 호출로)
+                        if driver.execute_script(_CLICK_IF_VISIBLE_JS, element, None, None):
+                            if WaitUtils.wait_for_condition(driver, EC.url_changes(old_url), self.config.WAIT_TIMEOUT):
+                                return WaitUtils.wait_for_page_load(driver, self.config.PAGE_LOAD_TIMEOUT)
+                    except:
+                        continue
             
             self.logger.log_message(f"{bank_name} 은행을 찾을 수 없습니다.")
             return False
@@ -1232,90 +1445,29 @@ class BankScraper:
     def select_category(self, driver, category):
         """특정 카테고리 탭을 클릭합니다."""
         try:
+            # 이미 선택된 탭이면 클릭하지 않음 (바뀔 테이블이 없어 전환 대기가 시간 초과까지 감)
+            if driver.execute_script(_CATEGORY_TAB_ACTIVE_JS, category):
+                return True
+
+            # 탭 전환 완료 판정용 현재 테이블 요약
+            old_signature = driver.execute_script(_TABLES_SIGNATURE_JS)
+
             # 방법 1: 정확한 텍스트 매칭
-            tab_xpaths = [
-                f"//a[normalize-space(text())='{category}']",
-                f"//a[contains(@class, 'tab') and contains(text(), '{category}')]",
-                f"//li[contains(@class, 'tab') and contains(text(), '{category}')]",
-                f"//span[contains(text(), '{category}')]",
-                f"//button[contains(text(), '{category}')]"
-            ]
+            tab_xpaths = self._category_xpaths.get(category) or self._build_category_xpaths(category)
             
-            for xpath in tab_xpaths:
-                elements = driver.find_elements(By.XPATH, xpath)
-                for element in elements:
-                    try:
-                        if element.is_displayed():
-                            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            WaitUtils.wait_with_random(0.3, 0.5)
-                            driver.execute_script("arguments[0].click();", element)
-                            WaitUtils.wait_with_random(0.5, 1)
-                            return True
-                    except:
-                        continue
+            # XPath 5개를 브라우저에서 순서대로 평가 (find_elements 왕복 없이 한 번의 호출)
+            if driver.execute_script(_CLICK_FIRST_VISIBLE_XPATH_JS, tab_xpaths):
+                WaitUtils.wait_for_tab_switch(driver, old_signature)
+                return True
             
             # 방법 2: JavaScript로 카테고리 탭 클릭
-            category_indices = {
-                "영업개황": 0,
-                "재무현황": 1,
-                "손익현황": 2,
-                "기타": 3
-            }
-            
-            if category in category_indices:
-                idx = category_indices[category]
-                script = f"""
-                // 모든 탭 관련 요소 찾기
-                var tabContainers = document.querySelectorAll('ul.tabs, div.tab-container, nav, .tab-list, ul, div[role="tablist"]');
-                
-                // 정확한 텍스트 매칭
-                var allElements = document.querySelectorAll('a, button, span, li, div');
-                for (var k = 0; k < allElements.length; k++) {{
-                    if (allElements[k].innerText.trim() === '{category}') {{
-                        allElements[k].scrollIntoView({{block: 'center'}});
-                        allElements[k].click();
-                        return "exact_match";
-                    }}
-                }}
-                
-                // 탭 컨테이너에서 인덱스 기반 검색
-                for (var i = 0; i < tabContainers.length; i++) {{
-                    var tabs = tabContainers[i].querySelectorAll('a, li, button, div[role="tab"], span');
-                    
-                    // 먼저 텍스트로 찾기
-                    for (var j = 0; j < tabs.length; j++) {{
-                        if (tabs[j].innerText.includes('{category}')) {{
-                            tabs[j].scrollIntoView({{block: 'center'}});
-                            tabs[j].click();
-                            return "text_match_in_container";
-                        }}
-                    }}
-                    
-                    // 인덱스로 찾기
-                    if (tabs.length >= {idx + 1}) {{
-                        tabs[{idx}].scrollIntoView({{block: 'center'}});
-                        tabs[{idx}].click();
-                        return "index_match";
-                    }}
-                }}
-                
-                // 모든 클릭 가능 요소에서 포함 문자열 검색
-                var clickables = document.querySelectorAll('a, button, span, div, li');
-                for (var j = 0; j < clickables.length; j++) {{
-                    if (clickables[j].innerText.includes('{category}')) {{
-                        clickables[j].scrollIntoView({{block: 'center'}});
-                        clickables[j].click();
-                        return "contains_match";
-                    }}
-                }}
-                
-                return false;
-                """
-                
-                result = driver.execute_script(script)
+            if category in _CATEGORY_TAB_INDICES:
+                result = driver.execute_script(
+                    _SELECT_CATEGORY_TAB_JS, category, _CATEGORY_TAB_INDICES[category]
+                )
                 if result:
                     self.logger.log_message(f"{category} 탭: {result} 성공", verbose=False)
-                    WaitUtils.wait_with_random(0.5, 1)
+                    WaitUtils.wait_for_tab_switch(driver, old_signature)
                     return True
             
             # 방법 3: 포함 문자열로 검색 (더 관대한 매칭)
@@ -1324,11 +1476,8 @@ class BankScraper:
             
             for element in elements:
                 try:
-                    if element.is_displayed() and (element.tag_name in ['a', 'li', 'span', 'button', 'div']):
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                        WaitUtils.wait_with_random(0.3, 0.5)
-                        driver.execute_script("arguments[0].click();", element)
-                        WaitUtils.wait_with_random(0.5, 1)
+                    if driver.execute_script(_CLICK_IF_VISIBLE_JS, element, ['a', 'li', 'span', 'button', 'div'], None):
+                        WaitUtils.wait_for_tab_switch(driver, old_signature)
                         return True
                 except:
                     continue
@@ -1339,11 +1488,8 @@ class BankScraper:
             
             for tab in tabs:
                 try:
-                    if category in tab.text and tab.is_displayed():
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                        WaitUtils.wait_with_random(0.3, 0.5)
-                        driver.execute_script("arguments[0].click();", tab)
-                        WaitUtils.wait_with_random(0.5, 1)
+                    if driver.execute_script(_CLICK_IF_VISIBLE_JS, tab, None, category):
+                        WaitUtils.wait_for_tab_switch(driver, old_signature)
                         return True
                 except:
                     continue
@@ -1360,12 +1506,14 @@ class BankScraper:
         try:
             # 페이지가 완전히 로드될 때까지 대기
             WaitUtils.wait_for_page_load(driver, self.config.PAGE_LOAD_TIMEOUT)
-            WaitUtils.wait_with_random(0.5, 1)
+
+            # 페이지 HTML은 한 번만 받아 pandas/BeautifulSoup 두 경로에서 공유
+            html_source = driver.page_source
             
             # 방법 1: pandas로 테이블 추출
             try:
-                html_source = driver.page_source
-                dfs = pd.read_html(StringIO(html_source))
+                # lxml(C 파서) 고정 — 없으면 pandas 기본 경로 사용
+                dfs = pd.read_html(StringIO(html_source), flavor='lxml' if LXML_AVAILABLE else None)
                 
                 if dfs:
                     valid_dfs = []
@@ -1376,26 +1524,12 @@ class BankScraper:
                         if not df.empty and df.shape[0] > 0 and df.shape[1] > 0:
                             # MultiIndex 컬럼 처리
                             if isinstance(df.columns, pd.MultiIndex):
-                                new_cols = []
-                                for col in df.columns:
-                                    if isinstance(col, tuple):
-                                        clean_col = [str(c).strip() for c in col if str(c).strip() and str(c).lower() != 'nan']
-                                        new_cols.append('_'.join(clean_col) if clean_col else f"Column_{len(new_cols)+1}")
-                                    else:
-                                        new_cols.append(str(col))
-                                df.columns = new_cols
+                                df.columns = _flatten_columns(df.columns)
                             
                             # 중복 테이블 제거
                             try:
-                                # 테이블 해시 생성 (중복 확인용)
-                                shape_hash = f"{df.shape}"
-                                headers_hash = f"{list(df.columns)}"
-                                data_hash = ""
-                                if len(df) > 0:
-                                    # 데이터 첫 행의 값들을 해시 생성
-                                    data_hash = f"{list(df.iloc[0].astype(str))}"
-                                
-                                table_hash = f"{shape_hash}_{headers_hash}_{data_hash}"
+                                # 테이블 해시 생성 (중복 확인용) — 컬럼 + 내용의 pandas 벡터화 해시
+                                table_hash = _table_fingerprint(df)
                                 
                                 if table_hash not in seen_shapes:
                                     valid_dfs.append(df)
@@ -1410,7 +1544,9 @@ class BankScraper:
             
             # 방법 2: BeautifulSoup으로 테이블 추출 (pandas 실패 시)
             try:
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                # <table> 하위 트리만 파싱 (스크립트/헤더/푸터 DOM은 건너뜀)
+                soup = BeautifulSoup(html_source, 'lxml' if LXML_AVAILABLE else 'html.parser',
+                                     parse_only=_TABLE_STRAINER)
                 tables = soup.find_all('table')
                 
                 extracted_dfs = []
@@ -1452,19 +1588,14 @@ class BankScraper:
                         
                         # 행 데이터가 있으면 DataFrame 생성
                         if rows and headers:
-                            # 열 개수 맞추기
-                            for i, row in enumerate(rows):
-                                if len(row) < len(headers):
-                                    rows[i] = row + [''] * (len(headers) - len(row))
-                                elif len(row) > len(headers):
-                                    rows[i] = row[:len(headers)]
-                            
-                            df = pd.DataFrame(rows, columns=headers)
+                            # 열 개수 맞추기 — 행 길이가 달라도 pandas가 한 번에 채우고 잘라냄
+                            df = pd.DataFrame(rows).reindex(columns=range(len(headers))).fillna('')
+                            df.columns = headers
                             
                             if not df.empty:
                                 # 테이블 해시 생성 (중복 확인용)
                                 try:
-                                    table_hash = f"{df.shape}_{hash(str(df.iloc[0].values) if len(df) > 0 else '')}"
+                                    table_hash = _table_fingerprint(df)
                                     if table_hash not in table_hashes:
                                         extracted_dfs.append(df)
                                         table_hashes.add(table_hash)
@@ -1508,6 +1639,7 @@ class BankScraper:
             
             result_data = {'날짜정보': date_info}
             all_table_hashes = set()  # 중복 테이블 제거용
+            has_data = False  # 유효 테이블을 하나라도 저장했는지
             
             # 각 카테고리 처리
             for category in self.config.CATEGORIES:
@@ -1526,15 +1658,9 @@ class BankScraper:
                     # 중복 제거된 유효 테이블 저장
                     valid_tables = []
                     for df in tables:
-                        # 테이블 해시 생성 (중복 확인용)
+                        # 테이블 해시 생성 (중복 확인용) — 컬럼 + 내용의 pandas 벡터화 해시
                         try:
-                            shape_hash = f"{df.shape}"
-                            headers_hash = f"{list(df.columns)}"
-                            data_hash = ""
-                            if len(df) > 0:
-                                data_hash = f"{list(df.iloc[0].astype(str))}"
-                            
-                            table_hash = f"{shape_hash}_{headers_hash}_{data_hash}"
+                            table_hash = _table_fingerprint(df)
                             
                             if table_hash not in all_table_hashes:
                                 valid_tables.append(df)
@@ -1545,13 +1671,14 @@ class BankScraper:
                     # 유효한 테이블 저장
                     if valid_tables:
                         result_data[category] = valid_tables
+                        has_data = True
                         self.logger.log_message(f"{bank_name} 은행 {category} 카테고리에서 {len(valid_tables)}개 테이블 추출")
                 
                 except Exception as e:
                     self.logger.log_message(f"{bank_name} 은행 {category} 카테고리 처리 실패: {str(e)}")
             
             # 데이터 수집 여부 확인
-            if not any(isinstance(data, list) and data for key, data in result_data.items() if key != '날짜정보'):
+            if not has_data:
                 self.logger.log_message(f"{bank_name} 은행에서 데이터를 추출할 수 없습니다.")
                 return None
             
@@ -1575,15 +1702,21 @@ class BankScraper:
             # 파일명에 날짜 정보 포함
             excel_path = os.path.join(self.config.output_dir, f"{bank_name}_결산_{date_info}.xlsx")
             
-            with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+            # xlsxwriter constant_memory: 행을 쓰는 즉시 디스크로 흘려보내 셀 객체를 쌓지 않음
+            # 이미 내보낸 행에 쓰면 버려지므로 모든 시트는 행 단위로 쓰는 write_sheet로만 기록
+            # (to_excel은 컬럼 단위로 쓰므로 이 모드에서 사용하면 안 됨, xlsxwriter가 없으면 openpyxl 사용)
+            if XLSXWRITER_AVAILABLE:
+                writer_kwargs = {'engine': 'xlsxwriter',
+                                 'engine_kwargs': {'options': {'constant_memory': True, 'strings_to_urls': False}}}
+            else:
+                writer_kwargs = {'engine': 'openpyxl'}
+
+            with pd.ExcelWriter(excel_path, **writer_kwargs) as writer:
                 # 날짜 정보 시트 생성
-                date_df = pd.DataFrame({
-                    '은행명': [bank_name],
-                    '공시 날짜': [date_info],
-                    '추출 일시': [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-                    '스크래핑 시스템': [f'결산공시 자동 스크래퍼 v{self.config.VERSION}']
-                })
-                date_df.to_excel(writer, sheet_name='공시정보', index=False)
+                info_headers = ['은행명', '공시 날짜', '추출 일시', '스크래핑 시스템']
+                info_values = [bank_name, date_info, datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                               f'결산공시 자동 스크래퍼 v{self.config.VERSION}']
+                write_sheet(writer, pd.DataFrame([info_values], columns=info_headers), '공시정보')
                 
                 # 각 카테고리별 데이터 저장
                 for category, tables in data_dict.items():
@@ -1604,17 +1737,10 @@ class BankScraper:
                         
                         # MultiIndex 확인 및 처리
                         if isinstance(df.columns, pd.MultiIndex):
-                            new_cols = []
-                            for col in df.columns:
-                                if isinstance(col, tuple):
-                                    col_parts = [str(c).strip() for c in col if str(c).strip() and str(c).lower() != 'nan']
-                                    new_cols.append('_'.join(col_parts) if col_parts else f"Column_{len(new_cols)+1}")
-                                else:
-                                    new_cols.append(str(col))
-                            df.columns = new_cols
+                            df.columns = _flatten_columns(df.columns)
                         
                         # 데이터프레임 저장
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+                        write_sheet(writer, df, sheet_name)
             
             self.logger.log_message(f"{bank_name} 은행 데이터 저장 완료: {excel_path}")
             return True
@@ -3496,12 +3622,14 @@ class BankScraper:
             zip_filename = os.path.join(os.path.dirname(self.config.output_dir), 
                                       f'저축은행_결산공시_데이터_{self.config.today}.zip')
             
-            with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
                 for root, dirs, files in os.walk(self.config.output_dir):
                     for file in files:
                         file_path = os.path.join(root, file)
                         arcname = os.path.relpath(file_path, os.path.dirname(self.config.output_dir))
-                        zipf.write(file_path, arcname)
+                        compress_type = (zipfile.ZIP_STORED if file.lower().endswith(_PRECOMPRESSED_EXTS)
+                                         else zipfile.ZIP_DEFLATED)
+                        zipf.write(file_path, arcname, compress_type=compress_type)
             
             self.logger.log_message(f"압축 파일 생성 완료: {zip_filename}")
             return zip_filename
@@ -4460,7 +4588,7 @@ class SettlementScraperTab:
         """별도 스레드에서 실행되는 압축 파일 생성 함수"""
         try:
             # 압축 작업 수행
-            with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=3) as zipf:
                 # 진행 상황 모니터링 변수
                 total_files = 0
                 for root, _, files in os.walk(self.config.output_dir):
@@ -4473,7 +4601,9 @@ class SettlementScraperTab:
                     for file in files:
                         file_path = os.path.join(root, file)
                         arcname = os.path.relpath(file_path, os.path.dirname(self.config.output_dir))
-                        zipf.write(file_path, arcname)
+                        compress_type = (zipfile.ZIP_STORED if file.lower().endswith(_PRECOMPRESSED_EXTS)
+                                         else zipfile.ZIP_DEFLATED)
+                        zipf.write(file_path, arcname, compress_type=compress_type)
                         
                         # 진행 상황 업데이트
                         files_processed += 1
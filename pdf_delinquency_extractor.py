@@ -1,21 +1,27 @@
 """
 통일경영공시 PDF에서 은행별 연체대출비율을 추출하여 엑셀로 정리하는 모듈.
 - 자산건전성 지표 항목 내 연체대출비율(금액기준)을 타겟으로 추출
-- Gemini OCR 기반 추출 (1차)
+- Gemini OCR 기반 추출 (1차, 자산건전성 지표 페이지만 잘라서 전송)
+- pypdfium2 기반 빠른 페이지 텍스트 추출 (자산건전성 지표 페이지 판별용)
 - pdfplumber 기반 테이블/텍스트 추출 (fallback, 자산건전성 지표 페이지 우선)
 - 별도 엑셀 파일로 생성
 """
 
+import io
 import os
 import re
 import json
+import asyncio
 import time
+import random
+import hashlib
 import logging
+import threading
+import functools
+import multiprocessing
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 try:
     import pdfplumber
@@ -23,6 +29,12 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 try:
     from google import genai
     from google.genai import types
@@ -63,6 +75,95 @@ _COUNT_BASED_KEYWORDS = [
     "건기준",
 ]
 
+# 연체율 탐색 최대 페이지 수 (통일경영공시는 양식이 고정되어 연체율 표가 앞쪽에 있음)
+# 추출이 실패하는 PDF가 있으면 이 값을 늘린다.
+DELINQ_MAX_PAGES = 40
+
+# 셀 텍스트 정규화용 공백 제거 테이블 (replace 체인 대신 translate 1회)
+# PDF에서 자주 나오는 NBSP(\u00a0)/전각 공백(\u3000)도 함께 제거
+_WS_TABLE = str.maketrans("", "", " \n\t\r\u00a0\u3000")
+
+# 페이지 텍스트 정규화용: 줄바꿈은 값 구분에 쓰이므로 남기고 공백류만 제거
+_SPACE_TABLE = str.maketrans("", "", " \u00a0\u3000")
+
+# 공백 제거 후 비교용 키워드 (호출마다 replace 하지 않도록 미리 계산)
+_ASSET_QUALITY_KEYWORDS_CLEAN = tuple(kw.replace(" ", "") for kw in _ASSET_QUALITY_KEYWORDS)
+_AMOUNT_BASED_KEYWORDS_CLEAN = tuple(kw.replace(" ", "") for kw in _AMOUNT_BASED_KEYWORDS)
+
+# 셀 유형 판별용 키워드 alternation (키워드마다 부분 문자열 검색하지 않고 1회 스캔)
+_AMOUNT_CELL_RE = re.compile("|".join(map(re.escape, _AMOUNT_BASED_KEYWORDS_CLEAN)))
+_COUNT_CELL_RE = re.compile("|".join(map(re.escape, _COUNT_BASED_KEYWORDS)))
+_GENERIC_CELL_RE = re.compile("|".join(map(re.escape, _GENERIC_DELINQUENCY_KEYWORDS)))
+
+# 자산건전성 지표 페이지 판별 / 헤더 전기·당기 컬럼 판별용 정규식 (키워드 루프 대신 1회 검색)
+_ASSET_QUALITY_RE = re.compile("|".join(map(re.escape, _ASSET_QUALITY_KEYWORDS_CLEAN)))
+_PERIOD_HEADER_RE = re.compile("전기|전년|당기|금기|공시기준|전년동기")
+_PRIOR_RE = re.compile("전기|전년|전분기|전년동기")
+_CURR_RE = re.compile("당기|당분기|금기|금분기|공시기준")
+
+# _parse_number 빠른 경로 / 빈 값 표기
+_NUM_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)[\s%]*$")
+_NUM_STRIP_TABLE = str.maketrans("", "", ", %\n\t\r")
+_EMPTY_NUMBER_TOKENS = frozenset(("-", "–", "—", "", "N/A", "N.A.", "해당없음", "해당사항없음"))
+
+# 텍스트 정규식 탐색용 패턴: 키워드 alternation 1개 + 당기 값 + (선택) 전기 값
+# → 키워드마다 검색하지 않고 한 번의 스캔으로 처리
+_NUM_PATTERN = r"\d+(?:\.\d+)?"
+_VALUE_TAIL = r"[^\d]*?(?P<cur>" + _NUM_PATTERN + r")(?:[%\s]+(?P<prev>" + _NUM_PATTERN + r"))?"
+_TEXT_AMOUNT_KEYWORDS = (
+    "연체대출비율(금액기준)", "연체대출채권비율(금액기준)", "연체대출금비율(금액기준)", "연체율(금액기준)",
+)
+_TEXT_AMOUNT_RE = re.compile(
+    "(?:" + "|".join(map(re.escape, _TEXT_AMOUNT_KEYWORDS)) + ")" + _VALUE_TAIL
+)
+_TEXT_GENERIC_RE = re.compile(
+    "(?P<kw>" + "|".join(map(re.escape, _GENERIC_DELINQUENCY_KEYWORDS)) + ")" + _VALUE_TAIL
+)
+
+# 분기총괄 시트 연체율 헤더 판별 키워드
+_HEADER_PRIOR_KWS = ("전년동기", "전기")
+_HEADER_CURRENT_KWS = ("금분기", "금기", "당기")
+
+# pdfplumber 테이블 추출 설정: 괘선(lines)만 사용해 단어 정렬 기반 추론을 건너뜀
+_LINE_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "intersection_tolerance": 3,
+    "min_words_vertical": 0,
+    "min_words_horizontal": 0,
+}
+
+# 괘선 없는 표용 fallback 설정 (단어 정렬 기반)
+_TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+}
+
+# 테이블 후보 우선순위: amount=0 (최우선), generic=1, count=2 (최후순위)
+_CELL_TYPE_PRIORITY = {"amount": 0, "generic": 1, "count": 2}
+
+# 추출 결과 캐시 폴더 (PDF 내용 해시 → 결과 JSON)
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "delinquency")
+
+# 캐시 형식/추출 로직 버전: 바뀌면 올려서 이전 결과를 무효화한다 (파일명과 내용에 모두 기록)
+_CACHE_VERSION = 2
+
+# 캐시에 기록하는 추출 방식
+_CACHE_METHOD_GEMINI = "gemini"
+_CACHE_METHOD_FALLBACK = "pdfplumber"
+
+# (경로, 수정시각, 크기) → 내용 해시. 변경 없는 파일은 다시 해시하지 않는다.
+_hash_memo: Dict[Tuple[str, float, int], str] = {}
+_hash_memo_lock = threading.Lock()
+
+# 다운로드 폴더 내 중복 PDF 판별에 사용할 앞부분 크기
+_HEAD_HASH_BYTES = 64 * 1024
+
+
+def _noop_log(msg) -> None:
+    """log_callback이 없을 때 쓰는 빈 로거."""
+
 
 def _classify_delinquency_cell(text: str) -> Optional[str]:
     """
@@ -73,81 +174,361 @@ def _classify_delinquency_cell(text: str) -> Optional[str]:
     """
     if not text:
         return None
-    cleaned = text.strip().replace(" ", "").replace("\n", "")
+    cleaned = text.translate(_WS_TABLE)
 
     # 1. 금액기준 명시 → 최우선
-    if any(kw.replace(" ", "") in cleaned for kw in _AMOUNT_BASED_KEYWORDS):
+    if _AMOUNT_CELL_RE.search(cleaned):
         return "amount"
 
     # 2. 건수기준 명시 → 후순위 (가능하면 제외)
-    if any(kw in cleaned for kw in _COUNT_BASED_KEYWORDS):
+    if _COUNT_CELL_RE.search(cleaned):
         return "count"
 
     # 3. 일반 연체율 키워드
-    if any(kw in cleaned for kw in _GENERIC_DELINQUENCY_KEYWORDS):
+    if _GENERIC_CELL_RE.search(cleaned):
         return "generic"
 
     return None
 
 
+# ============================================================
+# 추출 결과 캐시
+# ============================================================
+
+def _pdf_content_hash(pdf_path: str) -> Optional[str]:
+    """PDF 내용의 MD5 해시를 반환한다. 수정시각/크기가 같으면 이전 해시를 재사용한다."""
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
+
+    memo_key = (os.path.abspath(pdf_path), stat.st_mtime, stat.st_size)
+    with _hash_memo_lock:
+        cached = _hash_memo.get(memo_key)
+    if cached:
+        return cached
+
+    md5 = hashlib.md5()
+    try:
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                md5.update(chunk)
+    except OSError:
+        return None
+
+    digest = md5.hexdigest()
+    with _hash_memo_lock:
+        _hash_memo[memo_key] = digest
+    return digest
+
+
+def _cache_path(content_hash: str) -> str:
+    return os.path.join(_CACHE_DIR, f"{content_hash}.v{_CACHE_VERSION}.json")
+
+
+def _load_cached_result(content_hash: str, gemini_enabled: bool = False) -> Optional[Dict[str, str]]:
+    """
+    캐시된 추출 결과를 읽는다. 없거나 손상되었거나 버전이 다르면 None.
+    gemini_enabled면 Gemini로 당기/전기를 모두 얻은 결과만 사용한다
+    (pdfplumber fallback이나 일부 값만 있는 결과는 Gemini로 다시 추출해 교체).
+    """
+    try:
+        with open(_cache_path(content_hash), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        return None
+    result = payload.get("result")
+    if not isinstance(result, dict) or not result:
+        return None
+    if gemini_enabled and not (payload.get("method") == _CACHE_METHOD_GEMINI and payload.get("complete")):
+        return None
+    return result
+
+
+def _save_cached_result(content_hash: str, result: Dict[str, str], method: str) -> None:
+    """추출 결과를 추출 방식과 함께 캐시에 기록한다. 실패해도 추출 흐름에는 영향을 주지 않는다."""
+    cache_path = _cache_path(content_hash)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    payload = {
+        "version": _CACHE_VERSION,
+        "method": method,
+        "complete": "연체율_당기" in result and "연체율_전기" in result,
+        "result": result,
+    }
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"연체율 캐시 저장 실패 ({cache_path}): {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 # ============================================================
 # Gemini OCR 기반 연체율 추출
 # ============================================================
 
-def _extract_with_gemini(pdf_path: str, api_key: str, log_callback=None) -> Optional[Dict[str, str]]:
+_GEMINI_MODEL = "gemini-3-flash-preview"
+_GEMINI_MAX_PDF_BYTES = 20 * 1024 * 1024
+
+# Gemini에 잘라서 보낼 자산건전성 지표 페이지 최대 수
+_GEMINI_MAX_PAGES = 3
+
+# 비동기 Gemini 호출 동시 실행 수 (네트워크/OCR 대기가 대부분이라 스레드 풀보다 크게 잡음)
+_GEMINI_CONCURRENCY = 10
+
+# Gemini 요청 시작 속도 상한 (초당 요청 수) — 동시 요청이 한꺼번에 몰려 429가 나지 않도록
+_GEMINI_RPS = 2
+
+# 429/5xx 응답 재시도 횟수와 지수 백오프 범위(초)
+_GEMINI_MAX_RETRIES = 4
+_GEMINI_BACKOFF_MIN = 1.0
+_GEMINI_BACKOFF_MAX = 16.0
+
+_GEMINI_PROMPT = (
+    "이 통일경영공시 PDF에서 '자산건전성 지표' 항목 내 '연체대출비율'을 찾아주세요.\n\n"
+    "중요 사항:\n"
+    "1. 반드시 '자산건전성 지표' 섹션에 있는 '연체대출비율'만 추출하세요.\n"
+    "2. PDF에 '건수기준'과 '금액기준' 두 종류가 있을 수 있습니다.\n"
+    "   반드시 **금액기준** 연체대출비율만 추출하세요. 건수기준은 절대 사용하지 마세요.\n"
+    "3. '연체대출비율', '연체대출채권비율', '연체율' 등 표현이 다를 수 있으나 "
+    "모두 같은 항목입니다.\n\n"
+    "공시기준(당기) 값과 전년동기(전기) 값을 각각 추출해주세요.\n"
+    "반드시 아래 JSON 형식으로만 응답하세요:\n"
+    '{"연체율_당기": "숫자", "연체율_전기": "숫자"}\n'
+    "찾을 수 없으면 null로 표시하세요.\n"
+    "숫자는 퍼센트(%) 단위의 소수점 숫자만 넣으세요. (예: 2.35)"
+)
+
+
+def _build_gemini_request(pdf_bytes: bytes):
+    """Gemini generate_content 호출용 (contents, config)를 만든다."""
+    contents = [
+        types.Part.from_bytes(
+            data=pdf_bytes,
+            mime_type="application/pdf"
+        ),
+        _GEMINI_PROMPT
+    ]
+    config = types.GenerateContentConfig(
+        temperature=0.1,
+        max_output_tokens=256,
+        response_mime_type="application/json",
+    )
+    return contents, config
+
+
+def _parse_gemini_result(result_text: str, log) -> Optional[Dict[str, str]]:
+    """Gemini 응답 텍스트에서 연체율 값을 파싱·검증한다."""
+    if not result_text:
+        log("    [Gemini OCR] 빈 응답 (재시도 후에도 실패)")
+        return None
+
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+
+    # JSON 파싱 (작은따옴표 등 비표준 형식 대응)
+    try:
+        data = json.loads(result_text)
+    except json.JSONDecodeError:
+        # 작은따옴표 → 큰따옴표 치환 후 재시도
+        fixed = result_text.replace("'", '"')
+        try:
+            data = json.loads(fixed)
+        except json.JSONDecodeError:
+            # 정규식으로 직접 값 추출 시도
+            data = {}
+            for key in ["연체율_당기", "연체율_전기"]:
+                m = re.search(rf'["\']?{key}["\']?\s*[:=]\s*["\']?([\d.]+)', result_text)
+                if m:
+                    data[key] = m.group(1)
+            if not data:
+                log(f"    [Gemini OCR] JSON 파싱 실패: {result_text[:120]}")
+                return None
+
+    # 유효성 검증
+    result = {}
+    for key in ["연체율_당기", "연체율_전기"]:
+        val = data.get(key)
+        if val is not None and val != "null" and str(val).strip():
+            try:
+                num = float(str(val).replace("%", "").strip())
+                if 0 <= num <= 100:
+                    result[key] = str(num)
+            except (ValueError, TypeError):
+                pass
+
+    if result:
+        log(f"    [Gemini OCR] 금액기준 연체율 추출 성공: 당기 {result.get('연체율_당기', '-')}% / 전기 {result.get('연체율_전기', '-')}%")
+        return result
+    else:
+        log(f"    [Gemini OCR] 유효한 연체율 값 없음")
+        return None
+
+
+def _extract_page_texts_fast(pdf_path: str, max_pages: Optional[int] = None) -> Optional[List[str]]:
     """
-    Gemini API의 OCR 기능으로 PDF에서 금액기준 연체율을 추출한다.
+    pypdfium2로 페이지별 텍스트를 빠르게 추출한다 (키워드 판별용).
+    max_pages가 주어지면 앞에서부터 그 페이지 수까지만 추출한다.
+    pypdfium2가 없거나 열 수 없으면 None.
     """
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+    if not PDFIUM_AVAILABLE:
+        return None
+    try:
+        doc = pdfium.PdfDocument(pdf_path)
+    except Exception as e:
+        logger.debug(f"pypdfium2 열기 실패 ({pdf_path}): {e}")
+        return None
 
+    texts = []
     try:
-        client = genai.Client(api_key=api_key)
+        page_count = len(doc) if max_pages is None else min(len(doc), max_pages)
+        for page_num in range(page_count):
+            page = doc[page_num]
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range() or "")
+            textpage.close()
+            page.close()
+    except Exception as e:
+        logger.debug(f"pypdfium2 텍스트 추출 실패 ({pdf_path}): {e}")
+        return None
+    finally:
+        doc.close()
+    return texts
 
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
 
-        if len(pdf_bytes) > 20 * 1024 * 1024:
-            log("    [Gemini] PDF 크기가 20MB를 초과하여 건너뜁니다.")
-            return None
+def _find_asset_quality_pages(pdf_path: str, page_texts: Optional[List[str]] = None) -> List[int]:
+    """
+    자산건전성 지표 페이지 번호(0부터)를 찾는다. 연체 항목이 함께 있는 페이지를 우선한다.
+    page_texts가 주어지면 PDF를 다시 열지 않고 그대로 사용한다.
+    """
+    if page_texts is None:
+        page_texts = _extract_page_texts_fast(pdf_path, DELINQ_MAX_PAGES)
+    if page_texts is None:
+        if not PDFPLUMBER_AVAILABLE:
+            return []
+        with pdfplumber.open(pdf_path) as pdf:
+            page_texts = [page.extract_text() or "" for page in pdf.pages[:DELINQ_MAX_PAGES]]
 
-        prompt = (
-            "이 통일경영공시 PDF에서 '자산건전성 지표' 항목 내 '연체대출비율'을 찾아주세요.\n\n"
-            "중요 사항:\n"
-            "1. 반드시 '자산건전성 지표' 섹션에 있는 '연체대출비율'만 추출하세요.\n"
-            "2. PDF에 '건수기준'과 '금액기준' 두 종류가 있을 수 있습니다.\n"
-            "   반드시 **금액기준** 연체대출비율만 추출하세요. 건수기준은 절대 사용하지 마세요.\n"
-            "3. '연체대출비율', '연체대출채권비율', '연체율' 등 표현이 다를 수 있으나 "
-            "모두 같은 항목입니다.\n\n"
-            "공시기준(당기) 값과 전년동기(전기) 값을 각각 추출해주세요.\n"
-            "반드시 아래 JSON 형식으로만 응답하세요:\n"
-            '{"연체율_당기": "숫자", "연체율_전기": "숫자"}\n'
-            "찾을 수 없으면 null로 표시하세요.\n"
-            "숫자는 퍼센트(%) 단위의 소수점 숫자만 넣으세요. (예: 2.35)"
-        )
+    asset_quality_pages = []
+    delinquency_pages = []
+    for page_num, text in enumerate(page_texts):
+        text_clean = text.translate(_SPACE_TABLE)
+        if _ASSET_QUALITY_RE.search(text_clean):
+            asset_quality_pages.append(page_num)
+            if "연체" in text_clean:
+                delinquency_pages.append(page_num)
+
+    return (delinquency_pages or asset_quality_pages)[:_GEMINI_MAX_PAGES]
+
+
+def _slice_pdf_pages(pdf_path: str, page_indices: List[int]) -> bytes:
+    """지정한 페이지만 담은 새 PDF 바이트를 만든다."""
+    src = pdfium.PdfDocument(pdf_path)
+    dst = pdfium.PdfDocument.new()
+    try:
+        dst.import_pages(src, page_indices)
+        buf = io.BytesIO()
+        dst.save(buf)
+        return buf.getvalue()
+    finally:
+        dst.close()
+        src.close()
+
+
+def _read_pdf_for_gemini(pdf_path: str, log, page_texts: Optional[List[str]] = None) -> Optional[bytes]:
+    """
+    Gemini로 보낼 PDF 바이트를 읽는다.
+    자산건전성 지표 페이지를 찾으면 해당 페이지만 잘라 보내고, 못 찾으면 전체 PDF를 보낸다.
+    전체 PDF가 크기 제한을 넘으면 None.
+    """
+    if PDFIUM_AVAILABLE:
+        try:
+            pages = _find_asset_quality_pages(pdf_path, page_texts)
+            if pages:
+                sliced = _slice_pdf_pages(pdf_path, pages)
+                log(f"    [Gemini] 자산건전성 지표 페이지 {', '.join(str(p + 1) for p in pages)}만 전송")
+                return sliced
+        except Exception as e:
+            logger.debug(f"자산건전성 지표 페이지 추출 실패, 전체 PDF 전송 ({pdf_path}): {e}")
+
+    with open(pdf_path, "rb") as f:
+        pdf_bytes = f.read()
+
+    if len(pdf_bytes) > _GEMINI_MAX_PDF_BYTES:
+        log("    [Gemini] PDF 크기가 20MB를 초과하여 건너뜁니다.")
+        return None
+    return pdf_bytes
+
+
+def _is_retryable_gemini_error(e: Exception) -> bool:
+    """요청 제한(429)이나 서버 오류(5xx)처럼 다시 시도할 만한 오류인지 판별한다."""
+    code = getattr(e, "code", None)
+    return code == 429 or (isinstance(code, int) and 500 <= code < 600)
 
-        contents = [
-            types.Part.from_bytes(
-                data=pdf_bytes,
-                mime_type="application/pdf"
-            ),
-            prompt
-        ]
-        config = types.GenerateContentConfig(
-            temperature=0.1,
-            max_output_tokens=256,
-            response_mime_type="application/json",
-        )
+
+def _gemini_backoff_delay(retry: int) -> float:
+    """retry번째 재시도 전 대기 시간 (지수 백오프 + 지터)."""
+    delay = min(_GEMINI_BACKOFF_MAX, _GEMINI_BACKOFF_MIN * (2 ** retry))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class _AsyncRateLimiter:
+    """요청 시작 간격을 1/rate초 이상으로 유지하는 asyncio용 속도 제한기."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        # 잠금 안에서는 시작 시각만 예약하고, 대기는 잠금 밖에서 한다
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_client(api_key: str):
+    """API 키별 genai.Client를 재사용한다 (PDF마다 클라이언트/커넥션 생성 방지)."""
+    return genai.Client(api_key=api_key)
+
+
+def _extract_with_gemini(
+    pdf_path: str,
+    api_key: str,
+    log_callback=None,
+    page_texts: Optional[List[str]] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    Gemini API의 OCR 기능으로 PDF에서 금액기준 연체율을 추출한다.
+    """
+    log = log_callback or _noop_log
+
+    try:
+        client = _get_gemini_client(api_key)
+
+        pdf_bytes = _read_pdf_for_gemini(pdf_path, log, page_texts)
+        if pdf_bytes is None:
+            return None
+
+        contents, config = _build_gemini_request(pdf_bytes)
 
         # 빈 응답 시 1회 재시도 (모델이 간헐적으로 빈 텍스트 반환)
         result_text = ""
         for attempt in range(2):
-            response = client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=contents,
-                config=config,
-            )
+            response = _generate_content_with_retry(client, contents, config, log)
             result_text = (response.text or "").strip()
             if result_text:
                 break
@@ -155,58 +536,137 @@ def _extract_with_gemini(pdf_path: str, api_key: str, log_callback=None) -> Opti
                 log("    [Gemini OCR] 빈 응답 수신, 재시도...")
                 time.sleep(1)
 
-        if not result_text:
-            log("    [Gemini OCR] 빈 응답 (재시도 후에도 실패)")
-            return None
+        return _parse_gemini_result(result_text, log)
+
+    except Exception as e:
+        log(f"    [Gemini OCR] 오류: {e}")
+        return None
 
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
 
-        # JSON 파싱 (작은따옴표 등 비표준 형식 대응)
+def _generate_content_with_retry(client, contents, config, log):
+    """generate_content를 호출하고 429/5xx 오류는 지수 백오프로 재시도한다."""
+    for retry in range(_GEMINI_MAX_RETRIES + 1):
         try:
-            data = json.loads(result_text)
-        except json.JSONDecodeError:
-            # 작은따옴표 → 큰따옴표 치환 후 재시도
-            fixed = result_text.replace("'", '"')
-            try:
-                data = json.loads(fixed)
-            except json.JSONDecodeError:
-                # 정규식으로 직접 값 추출 시도
-                data = {}
-                for key in ["연체율_당기", "연체율_전기"]:
-                    m = re.search(rf'["\']?{key}["\']?\s*[:=]\s*["\']?([\d.]+)', result_text)
-                    if m:
-                        data[key] = m.group(1)
-                if not data:
-                    log(f"    [Gemini OCR] JSON 파싱 실패: {result_text[:120]}")
-                    return None
-
-        # 유효성 검증
-        result = {}
-        for key in ["연체율_당기", "연체율_전기"]:
-            val = data.get(key)
-            if val is not None and val != "null" and str(val).strip():
-                try:
-                    num = float(str(val).replace("%", "").strip())
-                    if 0 <= num <= 100:
-                        result[key] = str(num)
-                except (ValueError, TypeError):
-                    pass
+            return client.models.generate_content(
+                model=_GEMINI_MODEL,
+                contents=contents,
+                config=config,
+            )
+        except Exception as e:
+            if retry >= _GEMINI_MAX_RETRIES or not _is_retryable_gemini_error(e):
+                raise
+            delay = _gemini_backoff_delay(retry)
+            log(f"    [Gemini OCR] 요청 제한/서버 오류({getattr(e, 'code', '?')}), {delay:.1f}초 후 재시도...")
+            time.sleep(delay)
+
+
+async def _generate_content_with_retry_async(client, contents, config, rate_limiter, log):
+    """_generate_content_with_retry의 비동기 버전. 매 시도 전에 속도 제한기를 거친다."""
+    for retry in range(_GEMINI_MAX_RETRIES + 1):
+        await rate_limiter.wait()
+        try:
+            return await client.aio.models.generate_content(
+                model=_GEMINI_MODEL,
+                contents=contents,
+                config=config,
+            )
+        except Exception as e:
+            if retry >= _GEMINI_MAX_RETRIES or not _is_retryable_gemini_error(e):
+                raise
+            delay = _gemini_backoff_delay(retry)
+            log(f"    [Gemini OCR] 요청 제한/서버 오류({getattr(e, 'code', '?')}), {delay:.1f}초 후 재시도...")
+            await asyncio.sleep(delay)
 
-        if result:
-            log(f"    [Gemini OCR] 금액기준 연체율 추출 성공: 당기 {result.get('연체율_당기', '-')}% / 전기 {result.get('연체율_전기', '-')}%")
-            return result
-        else:
-            log(f"    [Gemini OCR] 유효한 연체율 값 없음")
+
+async def _extract_with_gemini_async(
+    client,
+    pdf_path: str,
+    semaphore: asyncio.Semaphore,
+    rate_limiter: _AsyncRateLimiter,
+    log_callback=None,
+    page_texts: Optional[List[str]] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    _extract_with_gemini의 비동기 버전 (client.aio 사용).
+    PDF 읽기/페이지 자르기는 세마포어 밖에서 하고 API 호출만 동시 실행 수를 제한하므로,
+    다음 PDF 준비가 진행 중인 요청과 겹쳐서 처리된다.
+    """
+    log = log_callback or _noop_log
+
+    try:
+        pdf_bytes = await asyncio.to_thread(_read_pdf_for_gemini, pdf_path, log, page_texts)
+        if pdf_bytes is None:
             return None
 
+        contents, config = _build_gemini_request(pdf_bytes)
+
+        # 빈 응답 시 1회 재시도 (모델이 간헐적으로 빈 텍스트 반환)
+        result_text = ""
+        async with semaphore:
+            for attempt in range(2):
+                response = await _generate_content_with_retry_async(
+                    client, contents, config, rate_limiter, log
+                )
+                result_text = (response.text or "").strip()
+                if result_text:
+                    break
+                if attempt == 0:
+                    log("    [Gemini OCR] 빈 응답 수신, 재시도...")
+                    await asyncio.sleep(1)
+
+        return _parse_gemini_result(result_text, log)
+
     except Exception as e:
         log(f"    [Gemini OCR] 오류: {e}")
         return None
 
 
+async def _extract_all_with_gemini_async(
+    pdf_files: List[Tuple[str, str, Optional[List[str]]]],
+    api_key: str,
+    log_callback=None,
+) -> Dict[str, Optional[Dict[str, str]]]:
+    """
+    여러 PDF를 Gemini에 동시에 요청한다. 성공한 결과는 캐시에 저장한다.
+    pdf_files는 (은행명, 경로, 미리 추출한 페이지 텍스트 또는 None) 목록.
+    """
+    # 풀링된 _get_gemini_client를 쓰지 않고 호출마다 새 클라이언트를 만든다:
+    # client.aio의 비동기 HTTP 커넥션 풀은 처음 사용한 이벤트 루프에 묶이는데,
+    # 이 함수는 _extract_pdfs에서 asyncio.run으로 매번 새 루프에서 실행되므로
+    # 이전 (이미 닫힌) 루프의 커넥션을 재사용하면 "Event loop is closed" 오류가 날 수 있다.
+    client = genai.Client(api_key=api_key)
+    semaphore = asyncio.Semaphore(_GEMINI_CONCURRENCY)
+    # 준비(읽기/자르기) 중이거나 전송 대기 중인 PDF 수 상한 (메모리에 올라가는 PDF 바이트 제한)
+    pipeline_slots = asyncio.Semaphore(_GEMINI_CONCURRENCY * 2)
+    rate_limiter = _AsyncRateLimiter(_GEMINI_RPS)
+
+    async def _bound_extract(bank_name, pdf_path, page_texts):
+        async with pipeline_slots:
+            content_hash = await asyncio.to_thread(_pdf_content_hash, pdf_path)
+
+            data = await _extract_with_gemini_async(
+                client, pdf_path, semaphore, rate_limiter, log_callback, page_texts
+            )
+            if data and content_hash:
+                _save_cached_result(content_hash, data, _CACHE_METHOD_GEMINI)
+            return bank_name, data
+
+    results = await asyncio.gather(
+        *[_bound_extract(bn, pp, texts) for bn, pp, texts in pdf_files],
+        return_exceptions=True,
+    )
+
+    results_map = {}
+    for (bn, _, _), item in zip(pdf_files, results):
+        if isinstance(item, BaseException):
+            if log_callback:
+                log_callback(f"  ❌ {bn}: 추출 오류 - {item}")
+            results_map[bn] = None
+        else:
+            results_map[bn] = item[1]
+    return results_map
+
+
 # ============================================================
 # pdfplumber 기반 연체율 추출 (fallback)
 # ============================================================
@@ -214,75 +674,139 @@ def _extract_with_gemini(pdf_path: str, api_key: str, log_callback=None) -> Opti
 def extract_delinquency_from_pdf(
     pdf_path: str,
     api_key: str = None,
-    log_callback=None
+    log_callback=None,
+    force_refresh: bool = False,
+    max_pages: Optional[int] = None,
 ) -> Optional[Dict[str, str]]:
     """
     단일 통일경영공시 PDF에서 연체율 값을 추출한다.
+    0차: PDF 내용 해시 기반 캐시 (force_refresh=True면 무시하고 다시 추출)
     1차: Gemini OCR (api_key가 있을 때)
     2차: pdfplumber 테이블 추출 (금액기준 우선)
     3차: pdfplumber 텍스트 정규식
+    max_pages: 앞에서부터 탐색할 최대 페이지 수 (기본 DELINQ_MAX_PAGES)
     """
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+    log = log_callback or _noop_log
 
     if not os.path.exists(pdf_path):
         return None
 
+    content_hash = _pdf_content_hash(pdf_path)
+    if content_hash and not force_refresh:
+        cached = _load_cached_result(content_hash, bool(api_key and GEMINI_AVAILABLE))
+        if cached:
+            log(f"    [캐시] 이전 추출 결과 사용: 당기 {cached.get('연체율_당기', '-')}% / 전기 {cached.get('연체율_전기', '-')}%")
+            return cached
+
+    if max_pages is None:
+        max_pages = DELINQ_MAX_PAGES
+    result, method = _extract_delinquency_uncached(pdf_path, api_key, log_callback, max_pages)
+    if result and content_hash:
+        _save_cached_result(content_hash, result, method)
+    return result
+
+
+def _extract_delinquency_uncached(
+    pdf_path: str,
+    api_key: str,
+    log_callback=None,
+    max_pages: int = DELINQ_MAX_PAGES,
+    page_texts: Optional[List[str]] = None,
+) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+    """
+    캐시를 거치지 않고 Gemini → pdfplumber 순서로 연체율을 추출한다. (결과, 추출 방식)을 반환한다.
+    page_texts가 주어지면 (이미 추출한 pypdfium2 페이지 텍스트) 다시 추출하지 않는다.
+    """
+    log = log_callback or _noop_log
+
+    # 페이지 텍스트는 한 번만 추출해 Gemini 페이지 선택과 fallback 페이지 판별에 같이 사용
+    # (pypdfium2가 없으면 None → 각 단계에서 pdfplumber로 추출)
+    if page_texts is None:
+        page_texts = _extract_page_texts_fast(pdf_path, max_pages)
+
     # 1차: Gemini OCR 시도
     if api_key and GEMINI_AVAILABLE:
-        result = _extract_with_gemini(pdf_path, api_key, log_callback)
+        result = _extract_with_gemini(pdf_path, api_key, log_callback, page_texts)
         if result:
-            return result
+            return result, _CACHE_METHOD_GEMINI
 
     # 2차/3차: pdfplumber fallback
+    result = _extract_with_pdfplumber(pdf_path, page_texts, log, max_pages)
+    return result, (_CACHE_METHOD_FALLBACK if result else None)
+
+
+def _extract_with_pdfplumber(
+    pdf_path: str,
+    page_texts: Optional[List[str]],
+    log,
+    max_pages: int = DELINQ_MAX_PAGES,
+) -> Optional[Dict[str, str]]:
+    """pdfplumber 테이블(금액기준 우선) → 텍스트 정규식 순서로 연체율을 추출한다."""
     if not PDFPLUMBER_AVAILABLE:
         log("    pdfplumber가 설치되지 않아 fallback 추출을 건너뜁니다.")
         return None
 
+    # pypdfium2 텍스트에 "연체"가 한 번도 없으면 pdfplumber로 열어볼 필요가 없음
+    if page_texts is not None and not any("연체" in text.translate(_SPACE_TABLE) for text in page_texts):
+        log(f"    [디버그] {len(page_texts)}페이지 텍스트에 연체 항목이 없어 pdfplumber 탐색 생략")
+        return None
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            # 자산건전성 지표 섹션이 있는 페이지를 우선 탐색
-            asset_quality_pages = []
+            # 페이지를 순서대로 한 번만 훑으면서 자산건전성 지표 페이지는 즉시 탐색
+            # (pdfplumber 기본값대로 laparams 레이아웃 분석은 사용하지 않음)
+            scan_pages = pdf.pages[:max_pages]
+            if page_texts is not None and len(page_texts) != len(scan_pages):
+                page_texts = None
+            asset_quality_count = 0
             other_pages = []
-            for page_num, page in enumerate(pdf.pages):
-                text = page.extract_text() or ""
-                text_clean = text.replace(" ", "")
-                if any(kw.replace(" ", "") in text_clean for kw in _ASSET_QUALITY_KEYWORDS):
-                    asset_quality_pages.append((page_num, page))
+            for page_num, page in enumerate(scan_pages):
+                # pdfplumber로 뽑은 텍스트는 텍스트 탐색 단계에서 그대로 재사용
+                plumber_text = None
+                if page_texts is not None:
+                    text = page_texts[page_num]
                 else:
-                    other_pages.append((page_num, page))
+                    text = plumber_text = page.extract_text() or ""
+                text_clean = text.translate(_SPACE_TABLE)
+                if not _ASSET_QUALITY_RE.search(text_clean):
+                    # "연체"가 없는 페이지는 테이블/텍스트 탐색 대상에서 제외
+                    if "연체" in text_clean:
+                        other_pages.append((page_num, page, plumber_text))
+                    continue
+
+                asset_quality_count += 1
+                # 자산건전성 지표 페이지라도 "연체"가 없으면 테이블 추출(가장 비싼 단계)을 생략
+                if "연체" not in text_clean:
+                    continue
 
-            # 2차: 자산건전성 지표 페이지 테이블에서 우선 탐색
-            for page_num, page in asset_quality_pages:
+                # 2차: 자산건전성 지표 페이지 테이블
                 result = _search_delinquency_in_page(page)
                 if result:
                     log(f"    [pdfplumber 테이블] 자산건전성 지표 페이지 {page_num + 1}에서 연체대출비율 발견")
                     return result
 
-            # 2-1차: 자산건전성 페이지가 없으면 전체 페이지 테이블 탐색
-            for page_num, page in other_pages:
-                result = _search_delinquency_in_page(page)
+                # 3차: 자산건전성 지표 페이지 텍스트
+                result = _search_delinquency_in_text(page, plumber_text)
                 if result:
-                    log(f"    [pdfplumber 테이블] 페이지 {page_num + 1}에서 연체대출비율 발견")
+                    log(f"    [pdfplumber 텍스트] 자산건전성 지표 페이지 {page_num + 1}에서 연체대출비율 발견")
                     return result
 
-            # 3차: 자산건전성 지표 페이지 텍스트 탐색
-            for page_num, page in asset_quality_pages:
-                result = _search_delinquency_in_text(page)
+            # 2-1차: 자산건전성 지표 페이지에서 못 찾으면 나머지 페이지 테이블 탐색
+            for page_num, page, _ in other_pages:
+                result = _search_delinquency_in_page(page)
                 if result:
-                    log(f"    [pdfplumber 텍스트] 자산건전성 지표 페이지 {page_num + 1}에서 연체대출비율 발견")
+                    log(f"    [pdfplumber 테이블] 페이지 {page_num + 1}에서 연체대출비율 발견")
                     return result
 
-            # 3-1차: 전체 페이지 텍스트 탐색
-            for page_num, page in other_pages:
-                result = _search_delinquency_in_text(page)
+            # 3-1차: 나머지 페이지 텍스트 탐색
+            for page_num, page, plumber_text in other_pages:
+                result = _search_delinquency_in_text(page, plumber_text)
                 if result:
                     log(f"    [pdfplumber 텍스트] 페이지 {page_num + 1}에서 연체대출비율 발견")
                     return result
 
             # 실패 시 디버그 정보
-            log(f"    [디버그] 총 {len(pdf.pages)}페이지 검색했으나 연체대출비율 미발견 (자산건전성 지표 페이지: {len(asset_quality_pages)}개)")
+            log(f"    [디버그] 총 {len(pdf.pages)}페이지 중 {len(scan_pages)}페이지 검색했으나 연체대출비율 미발견 (자산건전성 지표 페이지: {asset_quality_count}개)")
 
     except Exception as e:
         logger.error(f"PDF 파싱 오류 ({pdf_path}): {e}")
@@ -296,12 +820,22 @@ def _search_delinquency_in_page(page) -> Optional[Dict[str, str]]:
     페이지의 테이블에서 연체율 행을 찾는다.
     우선순위: 금액기준 > 일반 > 건수기준 (건수기준은 금액기준/일반이 없을 때만)
     """
-    tables = page.extract_tables()
+    # 괘선(선/사각형 테두리)이 하나도 없는 페이지는 표 추출을 건너뛰고 텍스트 정규식 단계에 맡김
+    # (text 전략 표는 컬럼이 어긋나기 쉬워 정규식보다 먼저 잘못된 셀을 집을 수 있음)
+    if not page.edges:
+        return None
+
+    # 공시 PDF 표는 대부분 괘선이 있으므로 괘선 기반으로만 먼저 추출 (문자 정렬 추론 생략)
+    tables = page.extract_tables(table_settings=_LINE_TABLE_SETTINGS)
+    if not tables:
+        # 괘선은 있지만 lines 전략으로 표가 잡히지 않는 경우에만 text 전략으로 한 번 더 시도
+        tables = page.extract_tables(table_settings=_TEXT_TABLE_SETTINGS)
     if not tables:
         return None
 
-    # 모든 테이블에서 연체율 후보를 수집
-    candidates = []  # [(priority, result), ...]
+    # 모든 테이블에서 가장 우선순위가 높은 연체율 후보를 추적
+    best_priority = None
+    best_result = None
 
     for table in tables:
         if not table:
@@ -312,14 +846,15 @@ def _search_delinquency_in_page(page) -> Optional[Dict[str, str]]:
         for h_idx in range(min(3, len(table))):
             row = table[h_idx]
             if row and any(
-                cell and any(kw in cell.strip().replace(" ", "").replace("\n", "")
-                             for kw in ["전기", "전년", "당기", "금기", "공시기준", "전년동기"])
+                _PERIOD_HEADER_RE.search(cell.translate(_WS_TABLE))
                 for cell in row if cell
             ):
                 header_row_idx = h_idx
                 break
 
         header_row = table[header_row_idx] if header_row_idx < len(table) else table[0]
+        # 전기/당기 컬럼은 테이블마다 한 번만 판별 (후보 행마다 헤더를 다시 정규화하지 않음)
+        period_cols = _identify_period_columns(header_row)
 
         for row_idx, row in enumerate(table):
             if not row or row_idx == header_row_idx:
@@ -331,25 +866,27 @@ def _search_delinquency_in_page(page) -> Optional[Dict[str, str]]:
                 if cell_type is None:
                     continue
 
-                result = _extract_values_from_row(table, row_idx, row, col_idx, header_row)
+                result = _extract_values_from_row(table, row_idx, row, col_idx, period_cols)
                 if result:
-                    # 우선순위: amount=0 (최우선), generic=1, count=2 (최후순위)
-                    priority = {"amount": 0, "generic": 1, "count": 2}[cell_type]
-                    candidates.append((priority, result))
-
-    if not candidates:
-        return None
+                    priority = _CELL_TYPE_PRIORITY[cell_type]
+                    if priority == 0:
+                        # 금액기준은 최우선이므로 더 찾을 필요 없음
+                        return result
+                    if best_priority is None or priority < best_priority:
+                        best_priority = priority
+                        best_result = result
 
-    # 최우선순위 결과 반환
-    candidates.sort(key=lambda x: x[0])
-    return candidates[0][1]
+    return best_result
 
 
 def _extract_values_from_row(
     table: list, row_idx: int, row: list, label_col: int,
-    header_row: list = None
+    period_cols: Optional[Tuple[set, set]] = None
 ) -> Optional[Dict[str, str]]:
-    """연체율이 발견된 행에서 수치 값을 추출한다."""
+    """
+    연체율이 발견된 행에서 수치 값을 추출한다.
+    period_cols는 _identify_period_columns 결과 (없으면 첫 행을 헤더로 보고 판별).
+    """
     numbers = []
     for col_idx, cell in enumerate(row):
         if col_idx == label_col:
@@ -372,9 +909,9 @@ def _extract_values_from_row(
     if not numbers:
         return None
 
-    if header_row is None:
-        header_row = table[0] if table else []
-    prior_cols, current_cols = _identify_period_columns(header_row)
+    if period_cols is None:
+        period_cols = _identify_period_columns(table[0] if table else [])
+    prior_cols, current_cols = period_cols
 
     result = {}
     if prior_cols and current_cols:
@@ -384,7 +921,7 @@ def _extract_values_from_row(
             elif col_idx in prior_cols:
                 result["연체율_전기"] = str(val)
     elif len(numbers) >= 2:
-        numbers.sort(key=lambda x: x[0])
+        # numbers는 enumerate 순서로 채워지므로 이미 컬럼 순으로 정렬되어 있음
         result["연체율_당기"] = str(numbers[0][1])
         result["연체율_전기"] = str(numbers[1][1])
     elif len(numbers) == 1:
@@ -404,72 +941,63 @@ def _identify_period_columns(header_row: list) -> Tuple[set, set]:
     for idx, cell in enumerate(header_row):
         if not cell:
             continue
-        cell_clean = cell.strip().replace(" ", "").replace("\n", "")
-        if any(kw in cell_clean for kw in ["전기", "전년", "전분기", "전년동기"]):
+        cell_clean = cell.translate(_WS_TABLE)
+        if _PRIOR_RE.search(cell_clean):
             prior_cols.add(idx)
-        elif any(kw in cell_clean for kw in ["당기", "당분기", "금기", "금분기", "공시기준"]):
+        elif _CURR_RE.search(cell_clean):
             current_cols.add(idx)
 
     return prior_cols, current_cols
 
 
-def _search_delinquency_in_text(page) -> Optional[Dict[str, str]]:
-    """페이지 텍스트에서 연체율 값을 정규식으로 추출한다. 금액기준 우선."""
-    text = page.extract_text()
+def _search_delinquency_in_text(page, text: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    페이지 텍스트에서 연체율 값을 정규식으로 추출한다. 금액기준 우선.
+    이미 pdfplumber로 뽑은 text가 있으면 다시 추출하지 않는다.
+    """
+    if text is None:
+        text = page.extract_text()
     if not text:
         return None
 
-    text_clean = text.replace(" ", "")
+    text_clean = text.translate(_SPACE_TABLE)
 
     # 1순위: 금액기준 명시적 패턴
-    for kw in ["연체대출비율(금액기준)", "연체대출채권비율(금액기준)", "연체대출금비율(금액기준)", "연체율(금액기준)"]:
-        kw_clean = kw.replace(" ", "")
-        if kw_clean not in text_clean:
-            continue
-        pattern = re.escape(kw_clean) + r"[^\d]*?([\d]+(?:\.[\d]+)?)[%\s]+([\d]+(?:\.[\d]+)?)"
-        match = re.search(pattern, text_clean)
-        if match:
-            return {"연체율_당기": match.group(1), "연체율_전기": match.group(2)}
-        pattern_one = re.escape(kw_clean) + r"[^\d]*?([\d]+(?:\.[\d]+)?)"
-        match = re.search(pattern_one, text_clean)
-        if match:
-            return {"연체율_당기": match.group(1)}
+    match = _TEXT_AMOUNT_RE.search(text_clean)
+    if match:
+        return _text_match_result(match)
 
     # 2순위: 일반 연체율 키워드 (건수기준이 아닌 경우)
-    # "건수기준"이 근처에 없는 연체율 패턴 매칭
-    for kw in _GENERIC_DELINQUENCY_KEYWORDS:
-        if kw not in text_clean:
-            continue
-
-        # 키워드 위치 찾기
-        pos = text_clean.find(kw)
-        if pos == -1:
-            continue
-
-        # 주변에 "건수기준"이 있으면 건너뛰기
-        context = text_clean[max(0, pos - 15):pos + len(kw) + 15]
+    # "건수기준"이 근처에 없는 첫 번째 연체율 패턴 매칭
+    for match in _TEXT_GENERIC_RE.finditer(text_clean):
+        pos = match.start()
+        context = text_clean[max(0, pos - 15):pos + len(match.group("kw")) + 15]
         if any(ck in context for ck in _COUNT_BASED_KEYWORDS):
             continue
+        return _text_match_result(match)
 
-        pattern_two = re.escape(kw) + r"[^\d]*?([\d]+(?:\.[\d]+)?)[%\s]+([\d]+(?:\.[\d]+)?)"
-        match = re.search(pattern_two, text_clean[pos:])
-        if match:
-            return {"연체율_당기": match.group(1), "연체율_전기": match.group(2)}
+    return None
 
-        pattern_one = re.escape(kw) + r"[^\d]*?([\d]+(?:\.[\d]+)?)"
-        match = re.search(pattern_one, text_clean[pos:])
-        if match:
-            return {"연체율_당기": match.group(1)}
 
-    return None
+def _text_match_result(match) -> Dict[str, str]:
+    """텍스트 패턴 매치를 결과 dict로 변환한다 (전기 값은 있을 때만)."""
+    if match.group("prev"):
+        return {"연체율_당기": match.group("cur"), "연체율_전기": match.group("prev")}
+    return {"연체율_당기": match.group("cur")}
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_number(text: str) -> Optional[float]:
-    """텍스트에서 숫자(연체율 %) 값을 파싱한다."""
+    """텍스트에서 숫자(연체율 %) 값을 파싱한다. 같은 셀 문자열이 반복되므로 결과를 캐시한다."""
     if not text:
         return None
-    cleaned = text.strip().replace(",", "").replace("%", "").replace(" ", "").replace("\n", "")
-    if cleaned in ("-", "–", "—", "", "N/A", "해당없음"):
+    # 빠른 경로: "2.35", " 2.35 %" 처럼 단순한 숫자는 정규식 1회로 처리
+    m = _NUM_RE.match(text)
+    if m:
+        val = float(m.group(1))
+        return val if 0 <= val <= 100 else None
+    cleaned = text.translate(_NUM_STRIP_TABLE)
+    if cleaned in _EMPTY_NUMBER_TOKENS:
         return None
     try:
         val = float(cleaned)
@@ -484,21 +1012,128 @@ def _parse_number(text: str) -> Optional[float]:
 # 공개 API 함수들
 # ============================================================
 
+def _safe_float(value):
+    """엑셀에 숫자로 기록되도록 float로 변환한다. 값이 없으면 "", 숫자가 아니면 원래 문자열."""
+    if value is None or value == "":
+        return ""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _extract_pdfs(
+    pdf_files: List[Tuple[str, str]],
+    api_key: str = None,
+    log_callback=None,
+    use_cache: bool = True,
+) -> Dict[str, Optional[Dict[str, str]]]:
+    """
+    여러 PDF에서 연체율을 추출해 {은행명: 결과 또는 None}을 반환한다.
+
+    캐시에 있는 PDF는 바로 결과를 쓰고 (use_cache=False면 조회하지 않고 모두 다시 추출해 캐시를 갱신),
+    Gemini 단계는 asyncio로 동시에 요청하며, Gemini로 못 찾은 PDF만
+    pdfplumber fallback을 프로세스 풀에서 처리한다 (PDF 파싱은 CPU 작업이라 GIL 회피).
+    Gemini를 쓰는 경우 페이지 텍스트는 PDF마다 한 번만 추출해 Gemini 페이지 선택과 fallback에 같이 넘긴다.
+    """
+    log = log_callback or _noop_log
+
+    results_map: Dict[str, Optional[Dict[str, str]]] = {}
+
+    # 0차: 이전 실행에서 추출한 PDF는 캐시 결과를 바로 사용 (Gemini 요청/작업 프로세스 생략)
+    # (해시는 작업 프로세스에 넘겨 PDF 전체를 다시 읽어 해시하지 않도록 함)
+    pending = []
+    gemini_enabled = bool(api_key and GEMINI_AVAILABLE)
+    for bank_name, pdf_path in pdf_files:
+        content_hash = _pdf_content_hash(pdf_path)
+        cached = _load_cached_result(content_hash, gemini_enabled) if content_hash and use_cache else None
+        if cached:
+            results_map[bank_name] = cached
+        else:
+            pending.append((bank_name, pdf_path, content_hash, None))
+    if len(pending) < len(pdf_files):
+        log(f"  [캐시] {len(pdf_files) - len(pending)}개 PDF는 이전 추출 결과 사용")
+
+    if pending and gemini_enabled:
+        # 페이지 텍스트를 PDF마다 한 번만 추출해 Gemini 페이지 선택과 fallback 양쪽에 전달
+        # (Gemini를 안 쓰면 작업 프로세스에서 병렬로 추출하도록 None으로 둠)
+        pending = [
+            (bn, pp, ch, _extract_page_texts_fast(pp, DELINQ_MAX_PAGES)) for bn, pp, ch, _ in pending
+        ]
+        gemini_files = [(bn, pp, texts) for bn, pp, _, texts in pending]
+        results_map.update(asyncio.run(_extract_all_with_gemini_async(gemini_files, api_key, log_callback)))
+        pending = [item for item in pending if not results_map.get(item[0])]
+
+    if not pending or not PDFPLUMBER_AVAILABLE:
+        return results_map
+
+    # 1개뿐이면 프로세스 생성 비용이 더 크므로 현재 프로세스에서 처리
+    if len(pending) < 2:
+        for item in pending:
+            bank_name, data, messages = _extract_one(item)
+            for msg in messages:
+                log(msg)
+            results_map[bank_name] = data
+        return results_map
+
+    max_workers = min(os.cpu_count() or 1, len(pending))
+    # 멀티스레드 프로세스(Streamlit 백그라운드 스레드)에서 호출되므로 fork 대신 spawn 사용
+    # (fork는 다른 스레드가 잡고 있던 잠금을 자식이 그대로 물려받아 교착될 수 있음)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(_extract_one, item): item[0] for item in pending}
+        for future in as_completed(futures):
+            bn = futures[future]
+            try:
+                bank_name, data, messages = future.result()
+            except Exception as e:
+                results_map[bn] = None
+                log(f"  ❌ {bn}: 추출 오류 - {e}")
+                continue
+            # 작업 프로세스의 로그는 모아서 받아 메인 프로세스 콜백으로 전달
+            for msg in messages:
+                log(msg)
+            results_map[bank_name] = data
+
+    return results_map
+
+
+def _extract_one(
+    item: Tuple[str, str, Optional[str], Optional[List[str]]]
+) -> Tuple[str, Optional[Dict[str, str]], List[str]]:
+    """
+    프로세스 풀 작업 단위: (은행명, 경로, 내용 해시, 페이지 텍스트) → (은행명, 결과, 로그 메시지 목록).
+    캐시 조회와 Gemini는 메인 프로세스에서 이미 거쳤으므로 pdfplumber 추출만 하고,
+    성공하면 전달받은 해시로 캐시에 저장한다. 페이지 텍스트가 있으면 다시 추출하지 않는다.
+    """
+    bank_name, pdf_path, content_hash, page_texts = item
+    messages: List[str] = []
+    data = None
+    if os.path.exists(pdf_path):
+        data, method = _extract_delinquency_uncached(
+            pdf_path, None, messages.append, DELINQ_MAX_PAGES, page_texts
+        )
+        if data and content_hash:
+            _save_cached_result(content_hash, data, method)
+    return bank_name, data, messages
+
+
 def create_delinquency_excel(
     download_path: str,
     output_path: Optional[str] = None,
     api_key: str = None,
     log_callback=None,
     existing_data: Optional[Dict[str, Dict[str, str]]] = None,
+    use_cache: bool = True,
 ) -> Optional[str]:
     """
     다운로드 폴더의 통일경영공시 PDF들에서 연체율을 추출하여 엑셀 파일을 생성한다.
 
     existing_data가 주어지면 중복 추출 없이 해당 데이터로 엑셀만 생성한다.
+    use_cache=False면 이전 추출 결과 캐시를 무시하고 모든 PDF를 다시 추출한다.
     """
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+    log = log_callback or _noop_log
 
     pdf_files = _find_disclosure_pdfs(download_path)
     if not pdf_files:
@@ -519,41 +1154,13 @@ def create_delinquency_excel(
 
         log(f"연체율 추출 시작: {len(pdf_files)}개 PDF ({method})")
 
-        max_workers = 5 if (api_key and GEMINI_AVAILABLE) else 3
-        results_map = {}
-
-        def _extract_one(bank_name, pdf_path):
-            return bank_name, extract_delinquency_from_pdf(pdf_path, api_key=api_key, log_callback=log_callback)
+        results_map = _extract_pdfs(pdf_files, api_key, log_callback, use_cache)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_extract_one, bn, pp): bn for bn, pp in pdf_files}
-            for future in as_completed(futures):
-                try:
-                    bank_name, data = future.result()
-                    results_map[bank_name] = data
-                except Exception as e:
-                    bn = futures[future]
-                    results_map[bn] = None
-                    log(f"  ❌ {bn}: 추출 오류 - {e}")
-
-    # 결과를 원래 순서대로 정렬
+    # 결과를 원래 순서대로 정렬 (write-only 시트에 바로 append할 튜플로 구성)
     rows = []
-    for bank_name, _ in pdf_files:
-        data = results_map.get(bank_name)
-        if data:
-            rows.append({
-                "No": len(rows) + 1,
-                "은행명": bank_name,
-                "연체율_전기(%)": data.get("연체율_전기", ""),
-                "연체율_당기(%)": data.get("연체율_당기", ""),
-            })
-        else:
-            rows.append({
-                "No": len(rows) + 1,
-                "은행명": bank_name,
-                "연체율_전기(%)": "",
-                "연체율_당기(%)": "",
-            })
+    for no, (bank_name, _) in enumerate(pdf_files, start=1):
+        data = results_map.get(bank_name) or {}
+        rows.append((no, bank_name, _safe_float(data.get("연체율_전기")), _safe_float(data.get("연체율_당기"))))
 
     elapsed = time.time() - t0
     elapsed_str = f"{int(elapsed // 60)}분 {int(elapsed % 60)}초" if elapsed >= 60 else f"{elapsed:.1f}초"
@@ -562,8 +1169,6 @@ def create_delinquency_excel(
         log("추출된 연체율 데이터가 없습니다.")
         return None
 
-    df = pd.DataFrame(rows)
-
     if not output_path:
         output_path = os.path.join(
             download_path,
@@ -571,15 +1176,23 @@ def create_delinquency_excel(
         )
 
     try:
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="연체율", index=False)
-            ws = writer.sheets["연체율"]
-            ws.column_dimensions["A"].width = 6
-            ws.column_dimensions["B"].width = 20
-            ws.column_dimensions["C"].width = 16
-            ws.column_dimensions["D"].width = 16
-
-        extracted_count = sum(1 for r in rows if r["연체율_당기(%)"])
+        from openpyxl import Workbook
+
+        # write-only 모드: pandas/ExcelWriter 없이 행 단위로 바로 기록
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("연체율")
+        # write-only 시트는 첫 행 기록 전에 컬럼 너비를 지정해야 반영됨
+        ws.column_dimensions["A"].width = 6
+        ws.column_dimensions["B"].width = 20
+        ws.column_dimensions["C"].width = 16
+        ws.column_dimensions["D"].width = 16
+
+        ws.append(["No", "은행명", "연체율_전기(%)", "연체율_당기(%)"])
+        for r in rows:
+            ws.append(r)
+        wb.save(output_path)
+
+        extracted_count = sum(1 for r in rows if r[3] != "")
         log(f"연체율 엑셀 생성 완료: {extracted_count}/{len(rows)}개 은행 ({elapsed_str})")
         return output_path
 
@@ -591,14 +1204,14 @@ def create_delinquency_excel(
 def extract_all_delinquency(
     download_path: str,
     api_key: str = None,
-    log_callback=None
+    log_callback=None,
+    use_cache: bool = True,
 ) -> Dict[str, Dict[str, str]]:
     """
     다운로드 폴더의 모든 통일경영공시 PDF에서 연체율을 추출한다.
+    use_cache=False면 이전 추출 결과 캐시를 무시하고 모든 PDF를 다시 추출한다.
     """
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+    log = log_callback or _noop_log
 
     pdf_files = _find_disclosure_pdfs(download_path)
     if not pdf_files:
@@ -614,22 +1227,8 @@ def extract_all_delinquency(
     t0 = time.time()
 
     # 병렬 추출
-    max_workers = 5 if (api_key and GEMINI_AVAILABLE) else 3
-    result = {}
-
-    def _extract_one(bank_name, pdf_path):
-        return bank_name, extract_delinquency_from_pdf(pdf_path, api_key=api_key, log_callback=log_callback)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_extract_one, bn, pp): bn for bn, pp in pdf_files}
-        for future in as_completed(futures):
-            try:
-                bank_name, data = future.result()
-                if data:
-                    result[bank_name] = data
-            except Exception as e:
-                bn = futures[future]
-                log(f"  ❌ {bn}: 추출 오류 - {e}")
+    results_map = _extract_pdfs(pdf_files, api_key, log_callback, use_cache)
+    result = {bn: data for bn, data in results_map.items() if data}
 
     elapsed = time.time() - t0
     elapsed_str = f"{int(elapsed // 60)}분 {int(elapsed % 60)}초" if elapsed >= 60 else f"{elapsed:.1f}초"
@@ -646,14 +1245,13 @@ def patch_excel_with_delinquency(
     if not delinquency_data or not excel_path or not os.path.exists(excel_path):
         return False
 
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+    log = log_callback or _noop_log
 
     try:
         from openpyxl import load_workbook
 
-        wb = load_workbook(excel_path)
+        # 외부 링크/VBA는 읽지 않음 (연체율 숫자 셀만 수정하므로 불필요)
+        wb = load_workbook(excel_path, keep_vba=False, keep_links=False)
         if "분기총괄" not in wb.sheetnames:
             log("분기총괄 시트를 찾을 수 없습니다.")
             wb.close()
@@ -672,9 +1270,9 @@ def patch_excel_with_delinquency(
             val_str = str(val).strip()
             if val_str == "회사명":
                 company_col = idx
-            elif "연체율" in val_str and any(kw in val_str for kw in ["전년동기", "전기"]):
+            elif "연체율" in val_str and any(kw in val_str for kw in _HEADER_PRIOR_KWS):
                 prior_col = idx
-            elif "연체율" in val_str and any(kw in val_str for kw in ["금분기", "금기", "당기"]):
+            elif "연체율" in val_str and any(kw in val_str for kw in _HEADER_CURRENT_KWS):
                 current_col = idx
 
         if company_col is None:
@@ -690,23 +1288,40 @@ def patch_excel_with_delinquency(
         log(f"  컬럼 위치: 회사명={company_col}, 연체율_전기={prior_col}, 연체율_당기={current_col}")
         log(f"  PDF 연체율 데이터: {len(delinquency_data)}개 은행")
 
+        # 은행명 매칭용 사전을 한 번만 구성 (원래 이름 / "저축은행" 제거 이름)
+        # (부분 일치 fallback에서도 재사용하도록 정규화 이름을 미리 계산)
+        # 값은 (전기, 당기)로 미리 숫자 변환해 두어 행마다 float() 변환을 반복하지 않음
+        parsed_data = {
+            pdf_bank: (_safe_float(data.get("연체율_전기")), _safe_float(data.get("연체율_당기")))
+            for pdf_bank, data in delinquency_data.items()
+        }
+        stripped_names = [
+            (pdf_bank, pdf_bank.replace("저축은행", "").strip(), data)
+            for pdf_bank, data in parsed_data.items()
+        ]
+        stripped_lookup = {}
+        for _, clean_pdf, data in stripped_names:
+            if clean_pdf:
+                stripped_lookup.setdefault(clean_pdf, data)
+
         patched = 0
-        for row_idx in range(2, ws.max_row + 1):
-            bank_name = ws.cell(row=row_idx, column=company_col + 1).value
+        # 행 단위로 셀 튜플을 한 번만 받아 읽기/쓰기 모두 같은 튜플에서 처리
+        # (필요한 컬럼까지만 읽어 뒤쪽 컬럼의 셀 객체는 만들지 않음)
+        max_col = max(c for c in (company_col, prior_col, current_col) if c is not None) + 1
+        for row_cells in ws.iter_rows(min_row=2, max_col=max_col):
+            bank_name = row_cells[company_col].value
             if not bank_name:
                 continue
             bank_name = str(bank_name).strip()
 
-            matched_data = None
-            if bank_name in delinquency_data:
-                matched_data = delinquency_data[bank_name]
-            else:
-                for pdf_bank, data in delinquency_data.items():
+            clean_bank = bank_name.replace("저축은행", "").strip()
+            matched_data = parsed_data.get(bank_name) or stripped_lookup.get(clean_bank)
+            if not matched_data:
+                # 사전에 없을 때만 부분 일치 탐색
+                for pdf_bank, clean_pdf, data in stripped_names:
                     if pdf_bank in bank_name or bank_name in pdf_bank:
                         matched_data = data
                         break
-                    clean_pdf = pdf_bank.replace("저축은행", "").strip()
-                    clean_bank = bank_name.replace("저축은행", "").strip()
                     if clean_pdf and clean_bank and (clean_pdf in clean_bank or clean_bank in clean_pdf):
                         matched_data = data
                         break
@@ -717,22 +1332,13 @@ def patch_excel_with_delinquency(
 
             updated = False
             # PDF OCR 추출 데이터가 ChatGPT 추정치보다 신뢰도가 높으므로 항상 덮어씀
-            if prior_col is not None and matched_data.get("연체율_전기"):
-                cell = ws.cell(row=row_idx, column=prior_col + 1)
-                try:
-                    cell.value = float(matched_data["연체율_전기"])
-                    cell.number_format = '0.00'
-                except (ValueError, TypeError):
-                    cell.value = matched_data["연체율_전기"]
-                updated = True
-
-            if current_col is not None and matched_data.get("연체율_당기"):
-                cell = ws.cell(row=row_idx, column=current_col + 1)
-                try:
-                    cell.value = float(matched_data["연체율_당기"])
+            for col, value in ((prior_col, matched_data[0]), (current_col, matched_data[1])):
+                if col is None or value == "":
+                    continue
+                cell = row_cells[col]
+                cell.value = value
+                if isinstance(value, float):
                     cell.number_format = '0.00'
-                except (ValueError, TypeError):
-                    cell.value = matched_data["연체율_당기"]
                 updated = True
 
             if updated:
@@ -752,21 +1358,42 @@ def patch_excel_with_delinquency(
 def _find_disclosure_pdfs(download_path: str) -> List[Tuple[str, str]]:
     """다운로드 폴더에서 통일경영공시 PDF 파일을 찾아 (은행명, 경로) 리스트를 반환한다."""
     results = []
+    seen = set()
     if not os.path.isdir(download_path):
         return results
 
-    for filename in sorted(os.listdir(download_path)):
-        if "통일경영공시" not in filename:
-            continue
-        if not filename.lower().endswith(".pdf"):
-            continue
+    # scandir의 DirEntry는 파일 종류를 캐시하므로 항목마다 stat을 다시 호출하지 않음
+    with os.scandir(download_path) as it:
+        entries = sorted(
+            (entry.name, entry.path) for entry in it
+            if "통일경영공시" in entry.name
+            and entry.name.lower().endswith(".pdf")
+            and entry.is_file()
+        )
 
-        filepath = os.path.join(download_path, filename)
-        if not os.path.isfile(filepath):
+    for filename, filepath in entries:
+        bank_name = filename.split("_통일경영공시")[0]
+        if not bank_name:
             continue
 
-        bank_name = filename.split("_통일경영공시")[0]
-        if bank_name:
-            results.append((bank_name, filepath))
+        # 같은 은행의 중복/재다운로드 사본은 첫 파일만 처리
+        head_hash = _pdf_head_hash(filepath)
+        if head_hash is not None:
+            key = (bank_name, head_hash)
+            if key in seen:
+                continue
+            seen.add(key)
+
+        results.append((bank_name, filepath))
 
     return results
+
+
+def _pdf_head_hash(pdf_path: str) -> Optional[Tuple[int, str]]:
+    """중복 판별용으로 (파일 크기, 앞부분 64KB의 md5)를 반환한다."""
+    try:
+        with open(pdf_path, "rb") as f:
+            head = f.read(_HEAD_HASH_BYTES)
+        return os.path.getsize(pdf_path), hashlib.md5(head).hexdigest()
+    except OSError:
+        return None
@@ -7,7 +7,7 @@ import os
 import sys
 import time
 import random
-import json
+import pickle
 import re
 import zipfile
 from datetime import datetime
@@ -16,7 +16,9 @@ import io
 from contextlib import contextmanager
 from pathlib import Path
 import tempfile
+import shutil
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -24,10 +26,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
 import pandas as pd
 import warnings
 
+from excel_utils import write_sheet
+
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -37,6 +40,39 @@ _stderr_lock = threading.Lock()
 # Chrome 드라이버 동시 생성 방지 (webdriver-manager 파일 잠금 충돌 방지)
 _chrome_init_lock = threading.Lock()
 
+# webdriver-manager로 받은 chromedriver 경로 (첫 생성 시 1회 확인 후 재사용, _chrome_init_lock 안에서만 갱신)
+_resolved_driver_path = None
+
+# 스크래핑 결과 캐시 — (공시 유형, 은행, 공시일)이 같으면 카테고리 탐색을 건너뜀
+_SCRAPE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "savings_bank_scraper")
+# 캐시 형식 버전 — 저장 구조가 바뀌면 올려서 이전 형식의 피클을 읽지 않도록 함
+_SCRAPE_CACHE_VERSION = 1
+# 캐시 유효 기간(초) — 같은 공시일로 올라온 정정공시나 잘못 파싱된 날짜가 계속 재사용되지 않도록 함
+_SCRAPE_CACHE_TTL = 12 * 60 * 60
+
+# 공시 날짜 추출/정규화용 정규식 (은행·카테고리마다 다시 컴파일하지 않도록 모듈 수준에서 1회)
+_DATE_RE = re.compile(r'\d{4}년\s*\d{1,2}월\s*말?')
+_YEAR_RE = re.compile(r'(\d{4})년')
+_MONTH_RE = re.compile(r'(\d{1,2})월')
+_YEAR_MONTH_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월')
+
+# XPath 2개에 해당하는 요소들의 화면 표시 텍스트를 한 번의 execute_script로 수집
+# (Selenium element.text와 같이 화면에 보이지 않는 요소는 제외)
+_COLLECT_DATE_TEXTS_JS = """
+function collect(xpath) {
+    var snap = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var texts = [];
+    for (var i = 0; i < snap.snapshotLength; i++) {
+        var el = snap.snapshotItem(i);
+        if (el.getClientRects().length === 0) continue;
+        var t = el.innerText;
+        if (t) texts.push(t);
+    }
+    return texts;
+}
+return [collect(arguments[0]), collect(arguments[1])];
+"""
+
 @contextmanager
 def suppress_stderr():
     """표준 에러 출력을 임시로 억제합니다 (스레드 안전)."""
@@ -53,6 +89,85 @@ def suppress_stderr():
         _stderr_lock.release()
 
 
+# select_bank: 은행명 표기가 여러 가지인 은행의 검색 이름 목록
+_EXACT_BANK_NAMES = {
+    "키움": ["키움", "키움저축은행"],
+    "키움YES": ["키움YES", "키움YES저축은행"],
+    "JT": ["JT", "JT저축은행"],
+    "JT친애": ["JT친애", "JT친애저축은행", "친애", "친애저축은행"],
+    "상상인": ["상상인", "상상인저축은행"],
+    "상상인플러스": ["상상인플러스", "상상인플러스저축은행"],
+    "머스트삼일": ["머스트삼일", "머스트삼일저축은행"]
+}
+
+# select_bank: arguments[0] = 검색 이름 목록, arguments[1] = 은행명
+_SELECT_BANK_JS = """
+var targetBankNames = new Set(arguments[0]);
+var bankName = arguments[1];
+var element = Array.prototype.find.call(document.querySelectorAll('td, a'), function(el) {
+    var text = el.textContent.trim();
+    if (!targetBankNames.has(text)) return false;
+    if (bankName === '키움' && text.includes('YES')) return false;
+    if (bankName === 'JT' && text.includes('친애')) return false;
+    return true;
+});
+if (!element) return false;
+
+element.scrollIntoView({block: 'center'});
+if (element.tagName === 'A') {
+    element.click();
+} else {
+    var link = element.querySelector('a');
+    (link || element).click();
+}
+return true;
+"""
+
+# select_category: arguments[0] = 카테고리 탭 이름 (고정 소스라 브라우저 스크립트 캐시 재사용)
+_SELECT_CATEGORY_JS = """
+var category = arguments[0];
+var allElements = document.querySelectorAll('a, button, span, li, div');
+for (var k = 0; k < allElements.length; k++) {
+    if (allElements[k].innerText.trim() === category) {
+        allElements[k].scrollIntoView({block: 'center'});
+        allElements[k].click();
+        return true;
+    }
+}
+return false;
+"""
+
+# 카테고리 탭이 이미 선택된 상태인지 판정 (arguments[0] = 카테고리명)
+# 텍스트가 일치하는 보이는 요소나 가까운 상위 요소(li까지, 최대 3단계)에 선택 표시(on/active/selected/current 클래스,
+# aria-selected)가 있으면 참 — 은행 선택 직후 기본 탭(주로 영업개황)은 클릭/대기 없이 바로 추출
+_CATEGORY_TAB_ACTIVE_JS = """
+var category = arguments[0];
+var pattern = /(^|\\s)(on|active|selected|current)(\\s|$)/i;
+var candidates = document.querySelectorAll('a, button, span, li');
+for (var k = 0; k < candidates.length; k++) {
+    var el = candidates[k];
+    if (el.innerText.trim() !== category || el.getClientRects().length === 0) continue;
+    for (var node = el, depth = 0; node && depth < 3; node = node.parentElement, depth++) {
+        if (node.getAttribute('aria-selected') === 'true' || pattern.test(node.getAttribute('class') || '')) return true;
+        if (node.tagName === 'LI') break;
+    }
+}
+return false;
+"""
+
+# 화면에 보이는 테이블들의 내용 요약 (탭 전환 후 테이블이 바뀌었는지 판정용, 보이는 테이블이 없으면 null)
+# 전체 페이지 이동이든 AJAX 교체/표시 전환이든 같은 방식으로 판정할 수 있음
+_TABLES_SIGNATURE_JS = """
+var parts = [];
+var tables = document.getElementsByTagName('table');
+for (var i = 0; i < tables.length; i++) {
+    if (tables[i].getClientRects().length === 0) continue;
+    var text = tables[i].innerText;
+    parts.push(text.length + ':' + text.slice(0, 200));
+}
+return parts.length ? parts.join('|') : null;
+"""
+
 class Config:
     """프로그램 설정을 관리하는 클래스"""
     VERSION = "3.1-streamlit"
@@ -102,6 +217,15 @@ class WaitUtils:
         except Exception:
             return False
 
+    @staticmethod
+    def wait_for_condition(driver, condition, timeout=3):
+        """조건이 충족되는 즉시 반환 (시간 초과 시 False)"""
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+            return True
+        except Exception:
+            return False
+
     @staticmethod
     def wait_with_random(min_sec=0.5, max_sec=1.5):
         """랜덤 대기"""
@@ -127,6 +251,14 @@ class StreamlitLogger:
         return "\n".join(self.messages)
 
 
+# create_driver: CDP로 차단할 하위 리소스 URL 패턴 (CSS는 innerText 가시성 판정에 필요해 유지)
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics*', '*googletagmanager*',
+]
+
+
 def create_driver():
     """Streamlit Cloud 환경에 맞는 Chrome 드라이버 생성 (고유 프로필 사용)
 
@@ -164,6 +296,12 @@ def _create_driver_internal():
         options.add_argument('--disable-infobars')
         options.add_argument('--disable-notifications')
         options.add_argument('--disable-popup-blocking')
+        # 렌더러 시작/페이지 로드 비용 축소 (사이트 동작에 필요한 JS는 유지)
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-features=TranslateUI,BackForwardCache,MediaRouter,'
+                             'OptimizationHints,InterestFeedContentSuggestions')
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--renderer-process-limit=1')
 
         prefs = {
             'profile.default_content_setting_values': {
@@ -205,31 +343,165 @@ def _create_driver_internal():
         if service:
             driver = webdriver.Chrome(service=service, options=options)
         else:
-            # webdriver-manager 사용 시도
+            # webdriver-manager 사용 시도 (한 번 받은 경로는 재사용 — 매번 버전 확인 요청하지 않음)
+            global _resolved_driver_path
             try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                from webdriver_manager.core.os_manager import ChromeType
-                service = Service(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install())
-                driver = webdriver.Chrome(service=service, options=options)
+                if _resolved_driver_path is None:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    from webdriver_manager.core.os_manager import ChromeType
+                    _resolved_driver_path = ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
+                driver = webdriver.Chrome(service=Service(_resolved_driver_path), options=options)
             except Exception:
                 driver = webdriver.Chrome(options=options)
 
         driver.set_page_load_timeout(30)
+        # 요소 탐색은 즉시 반환 — 대기는 모두 WaitUtils의 명시적 대기로 처리
+        driver.implicitly_wait(0)
+        # 종료 시 임시 프로필 정리를 위해 경로 보관
+        driver._chrome_user_data_dir = user_data_dir
+
+        # 이미지/폰트/미디어/트래커 요청은 네트워크 단계에서 차단 (HTML+JS만 로드)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+        except Exception:
+            pass
+
         return driver
 
 
+def _get_page_html(driver):
+    """현재 페이지 HTML을 반환합니다.
+
+    CDP DOM.getOuterHTML로 브라우저의 네이티브 직렬화 결과를 바로 받고,
+    CDP를 쓸 수 없는 드라이버에서는 page_source로 대체합니다.
+    """
+    try:
+        # depth 0: 문서 노드 ID만 필요하므로 하위 트리는 받아오지 않음
+        root = driver.execute_cdp_cmd('DOM.getDocument', {'depth': 0})
+        return driver.execute_cdp_cmd(
+            'DOM.getOuterHTML', {'nodeId': root['root']['nodeId']}
+        )['outerHTML']
+    except Exception:
+        return driver.page_source
+
+
+def _tables_changed(old_signature):
+    """보이는 테이블 요약이 old_signature와 달라지면 참이 되는 대기 조건."""
+    def _condition(driver):
+        try:
+            signature = driver.execute_script(_TABLES_SIGNATURE_JS)
+        except Exception:
+            # 문서 교체 중에는 스크립트가 실패할 수 있음 — 다음 폴링에서 다시 확인
+            return False
+        return signature is not None and signature != old_signature
+    return _condition
+
+
+def _scrape_cache_path(scrape_type, bank_name, date_info):
+    safe_date = date_info.replace('/', '_').replace(' ', '')
+    return os.path.join(
+        _SCRAPE_CACHE_DIR, f"v{_SCRAPE_CACHE_VERSION}_{scrape_type}_{bank_name}_{safe_date}.pkl"
+    )
+
+
+def _load_cached_tables(scrape_type, bank_name, date_info):
+    """캐시된 카테고리별 테이블을 읽습니다. 없거나 손상되었거나 유효 기간이 지난 경우 None."""
+    cache_path = _scrape_cache_path(scrape_type, bank_name, date_info)
+    try:
+        if time.time() - os.path.getmtime(cache_path) > _SCRAPE_CACHE_TTL:
+            return None
+        with open(cache_path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) and data else None
+
+
+def _save_cached_tables(scrape_type, bank_name, date_info, tables_by_category):
+    """카테고리별 테이블을 캐시에 기록합니다. 실패해도 스크래핑 흐름에는 영향 없음."""
+    cache_path = _scrape_cache_path(scrape_type, bank_name, date_info)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_SCRAPE_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(tables_by_category, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _quit_driver(driver):
+    """드라이버를 종료하고 Chrome 임시 프로필(user-data-dir)을 정리합니다."""
+    user_data_dir = getattr(driver, '_chrome_user_data_dir', None)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    # Chrome 임시 프로필 정리
+    if user_data_dir and os.path.exists(user_data_dir):
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
 class BankScraper:
     """은행 데이터 스크래퍼 클래스"""
 
-    def __init__(self, config, logger):
+    def __init__(self, config, logger, use_cache=True):
         self.config = config
         self.logger = logger
+        # False면 스크래핑 결과 캐시를 읽지 않고 항상 사이트에서 다시 받음 (받은 결과로 캐시는 갱신)
+        self.use_cache = use_cache
+        # 파일명에 쓰는 공시 구분명 (은행마다 다시 계산하지 않음)
+        self._scrape_type_name = "분기공시" if config.scrape_type == "quarterly" else "결산공시"
+        # 스레드별 Chrome 드라이버를 은행 간에 재사용 (은행마다 새로 띄우지 않음)
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _get_driver(self):
+        """현재 스레드의 드라이버를 반환합니다 (없으면 생성)."""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = create_driver()
+            self._local.driver = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _discard_driver(self):
+        """현재 스레드의 드라이버를 종료합니다. 다음 요청 시 새로 생성됩니다."""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            return
+        self._local.driver = None
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        _quit_driver(driver)
+
+    def close(self):
+        """이 스크래퍼가 띄운 모든 드라이버를 종료합니다."""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            _quit_driver(driver)
+        self._local = threading.local()
 
     @staticmethod
     def _date_sort_key(date_str):
         """날짜 문자열에서 (연도, 월) 튜플을 추출하여 정렬 키로 사용"""
-        year_match = re.search(r'(\d{4})년', date_str)
-        month_match = re.search(r'(\d{1,2})월', date_str)
+        year_match = _YEAR_RE.search(date_str)
+        month_match = _MONTH_RE.search(date_str)
         year = int(year_match.group(1)) if year_match else 0
         month = int(month_match.group(1)) if month_match else 0
         return (year, month)
@@ -239,7 +511,7 @@ class BankScraper:
         """날짜를 'YYYY년 MM월말' 형식으로 통일 (예: 2025년 09월말)"""
         if not date_str or date_str in ("날짜 정보 없음", "날짜 추출 실패"):
             return date_str
-        match = re.search(r'(\d{4})년\s*(\d{1,2})월', date_str)
+        match = _YEAR_MONTH_RE.search(date_str)
         if match:
             year = match.group(1)
             month = match.group(2).zfill(2)
@@ -249,38 +521,27 @@ class BankScraper:
     def extract_date_information(self, driver):
         """웹페이지에서 공시 날짜 정보를 추출합니다."""
         try:
-            date_pattern = re.compile(r'\d{4}년\s*\d{1,2}월\s*말?')
-
-            # 당기 데이터 우선 찾기
-            current_period_elements = driver.find_elements(
-                By.XPATH,
-                "//*[contains(text(), '당기') and contains(text(), '년') and contains(text(), '월')]"
+            # 두 XPath의 텍스트를 브라우저에서 한 번에 수집 (요소마다 .text 왕복 호출하지 않음)
+            current_texts, all_texts = driver.execute_script(
+                _COLLECT_DATE_TEXTS_JS,
+                "//*[contains(text(), '당기') and contains(text(), '년') and contains(text(), '월')]",
+                "//*[contains(text(), '년') and contains(text(), '월')]",
             )
 
-            if current_period_elements:
-                for element in current_period_elements:
-                    text = element.text
-                    matches = date_pattern.findall(text)
-                    if matches:
-                        latest_date = max(matches, key=self._date_sort_key)
-                        return self.normalize_date(latest_date)
+            # 당기 데이터 우선 찾기
+            for text in current_texts:
+                matches = _DATE_RE.findall(text)
+                if matches:
+                    latest_date = max(matches, key=self._date_sort_key)
+                    return self.normalize_date(latest_date)
 
             # 모든 날짜 찾기
-            all_date_elements = driver.find_elements(
-                By.XPATH,
-                "//*[contains(text(), '년') and contains(text(), '월')]"
-            )
-
             all_dates = []
-            for element in all_date_elements:
-                text = element.text
-                matches = date_pattern.findall(text)
-                all_dates.extend(matches)
+            for text in all_texts:
+                all_dates.extend(_DATE_RE.findall(text))
 
             if all_dates:
-                unique_dates = list(set(all_dates))
-                sorted_dates = sorted(unique_dates, key=self._date_sort_key, reverse=True)
-                return self.normalize_date(sorted_dates[0])
+                return self.normalize_date(max(all_dates, key=self._date_sort_key))
 
             return "날짜 정보 없음"
 
@@ -301,68 +562,18 @@ class BankScraper:
                 self.logger.log_message(f"{bank_name} 선택 실패: 페이지 로드 안 됨")
                 return False
 
-            WaitUtils.wait_with_random(0.5, 1)
-
-            # 은행명 매핑
-            exact_bank_names = {
-                "키움": ["키움", "키움저축은행"],
-                "키움YES": ["키움YES", "키움YES저축은행"],
-                "JT": ["JT", "JT저축은행"],
-                "JT친애": ["JT친애", "JT친애저축은행", "친애", "친애저축은행"],
-                "상상인": ["상상인", "상상인저축은행"],
-                "상상인플러스": ["상상인플러스", "상상인플러스저축은행"],
-                "머스트삼일": ["머스트삼일", "머스트삼일저축은행"]
-            }
+            search_names = _EXACT_BANK_NAMES.get(bank_name, [bank_name, f"{bank_name}저축은행"])
 
-            search_names = exact_bank_names.get(bank_name, [bank_name, f"{bank_name}저축은행"])
-
-            # JavaScript로 은행 선택
-            js_script = f"""
-            var targetBankNames = {json.dumps(search_names)};
-            var found = false;
-
-            var allElements = document.querySelectorAll('td, a');
-
-            for(var i = 0; i < allElements.length; i++) {{
-                var element = allElements[i];
-                var elementText = element.textContent.trim();
-
-                for(var j = 0; j < targetBankNames.length; j++) {{
-                    if(elementText === targetBankNames[j]) {{
-                        if('{bank_name}' === '키움' && elementText.includes('YES')) continue;
-                        if('{bank_name}' === 'JT' && elementText.includes('친애')) continue;
-
-                        element.scrollIntoView({{block: 'center'}});
-
-                        if(element.tagName === 'A') {{
-                            element.click();
-                            found = true;
-                            break;
-                        }} else {{
-                            var link = element.querySelector('a');
-                            if(link) {{
-                                link.click();
-                                found = true;
-                                break;
-                            }} else {{
-                                element.click();
-                                found = true;
-                                break;
-                            }}
-                        }}
-                    }}
-                }}
-                if(found) break;
-            }}
-
-            return found;
-            """
-
-            result = driver.execute_script(js_script)
-            if result:
-                WaitUtils.wait_with_random(1, 1.5)
-                if driver.current_url != self.config.BASE_URL:
-                    return True
+            # 클릭 전 실제 URL 기준으로 전환을 판정 (리다이렉트/파라미터가 붙은 목록 URL이어도 정확)
+            old_url = driver.current_url
+
+            # JavaScript로 은행 선택 (고정 스크립트 + 인자 전달, 첫 일치 요소에서 바로 종료)
+            result = driver.execute_script(_SELECT_BANK_JS, search_names, bank_name)
+            # 페이지 전환 확인 — URL이 바뀐 뒤 새 문서의 readyState까지 확인
+            if result and WaitUtils.wait_for_condition(
+                driver, EC.url_changes(old_url), self.config.WAIT_TIMEOUT
+            ):
+                return WaitUtils.wait_for_page_load(driver, self.config.WAIT_TIMEOUT)
 
             return False
 
@@ -373,29 +584,16 @@ class BankScraper:
     def select_category(self, driver, category):
         """카테고리 탭을 선택합니다."""
         try:
-            category_indices = {
-                "영업개황": 0,
-                "재무현황": 1,
-                "손익현황": 2,
-                "기타": 3
-            }
-
-            if category in category_indices:
-                script = f"""
-                var allElements = document.querySelectorAll('a, button, span, li, div');
-                for (var k = 0; k < allElements.length; k++) {{
-                    if (allElements[k].innerText.trim() === '{category}') {{
-                        allElements[k].scrollIntoView({{block: 'center'}});
-                        allElements[k].click();
-                        return true;
-                    }}
-                }}
-                return false;
-                """
-
-                result = driver.execute_script(script)
+            if category in self.config.CATEGORIES:
+                # 이미 선택된 탭이면 클릭하지 않음 (바뀔 테이블이 없어 전환 대기가 시간 초과까지 감)
+                if driver.execute_script(_CATEGORY_TAB_ACTIVE_JS, category):
+                    return True
+                old_signature = driver.execute_script(_TABLES_SIGNATURE_JS)
+                result = driver.execute_script(_SELECT_CATEGORY_JS, category)
                 if result:
-                    WaitUtils.wait_with_random(0.5, 1)
+                    # 이전 탭의 테이블이 새 내용으로 바뀌는 즉시 진행
+                    # (<html> staleness는 AJAX 탭 전환에서 끝나지 않고, table 존재 확인은 이전 테이블로도 통과함)
+                    WaitUtils.wait_for_condition(driver, _tables_changed(old_signature), 3)
                     return True
 
             return False
@@ -407,31 +605,37 @@ class BankScraper:
         """페이지에서 테이블을 추출합니다."""
         try:
             WaitUtils.wait_for_page_load(driver, self.config.PAGE_LOAD_TIMEOUT)
-            WaitUtils.wait_with_random(0.5, 1)
 
-            html_source = driver.page_source
-            dfs = pd.read_html(StringIO(html_source))
+            html_source = _get_page_html(driver)
+            try:
+                # lxml 파서 고정 — 기본값은 lxml 실패 시 훨씬 느린 BeautifulSoup으로 재시도함
+                dfs = pd.read_html(StringIO(html_source), flavor='lxml')
+            except ValueError:
+                # 테이블 없음
+                return []
 
             if dfs:
                 valid_dfs = []
-                seen_shapes = set()
+                seen_tables = set()
 
                 for df in dfs:
                     if not df.empty and df.shape[0] > 0 and df.shape[1] > 0:
                         if isinstance(df.columns, pd.MultiIndex):
-                            new_cols = []
-                            for col in df.columns:
-                                if isinstance(col, tuple):
-                                    clean_col = [str(c).strip() for c in col if str(c).strip() and str(c).lower() != 'nan']
-                                    new_cols.append('_'.join(clean_col) if clean_col else f"Column_{len(new_cols)+1}")
-                                else:
-                                    new_cols.append(str(col))
-                            df.columns = new_cols
-
-                        shape_hash = f"{df.shape}_{list(df.columns)}"
-                        if shape_hash not in seen_shapes:
+                            # MultiIndex 컬럼은 항상 튜플 — 빈 값/nan 레벨을 빼고 '_'로 결합
+                            df.columns = [
+                                '_'.join(p for p in (str(c).strip() for c in col)
+                                         if p and p.lower() != 'nan') or f"Column_{i+1}"
+                                for i, col in enumerate(df.columns)
+                            ]
+
+                        # 컬럼 + 내용 해시로 중복 판정 (pandas 벡터화 해시, 행 순서 무관)
+                        content_hash = (
+                            tuple(df.columns),
+                            int(pd.util.hash_pandas_object(df, index=False).sum()),
+                        )
+                        if content_hash not in seen_tables:
                             valid_dfs.append(df)
-                            seen_shapes.add(shape_hash)
+                            seen_tables.add(content_hash)
 
                 return valid_dfs
 
@@ -440,49 +644,76 @@ class BankScraper:
         except Exception as e:
             return []
 
-    def scrape_bank(self, bank_name, progress_callback=None):
-        """단일 은행 데이터 스크래핑 - 날짜 정보도 반환"""
-        driver = None
+    def scrape_bank(self, bank_name, progress_callback=None, extract_ts=None):
+        """단일 은행 데이터 스크래핑 - 날짜 정보도 반환
+
+        extract_ts: 정보 시트에 기록할 스크래핑 일시 (여러 은행을 한 번에 돌릴 때 공통값 전달)
+        """
         date_info = "날짜 정보 없음"
 
         try:
-            driver = create_driver()
+            driver = self._get_driver()
             self.logger.log_message(f"[시작] {bank_name} 은행 스크래핑")
 
             if not self.select_bank(driver, bank_name):
                 self.logger.log_message(f"{bank_name} 선택 실패")
+                # 재시도 시 새 브라우저로 시작하도록 폐기
+                self._discard_driver()
                 return None, False, date_info
 
             date_info = self.extract_date_information(driver)
             self.logger.log_message(f"{bank_name} 공시일: {date_info}")
+            # 파일명에 쓸 날짜 문자열은 공시일이 정해진 뒤 한 번만 만듦
+            safe_date = date_info.replace('/', '_').replace(' ', '')
 
             result_data = {'날짜정보': date_info}
 
-            for category in self.config.CATEGORIES:
-                if progress_callback:
-                    progress_callback(bank_name, f"{category} 처리 중")
-
-                if self.select_category(driver, category):
-                    tables = self.extract_tables_from_page(driver)
-                    if tables:
-                        result_data[category] = tables
-                        self.logger.log_message(f"{bank_name} - {category}: {len(tables)}개 테이블")
+            # 같은 공시일의 결과가 캐시에 있으면 카테고리 탐색 생략
+            cacheable = date_info not in ("날짜 정보 없음", "날짜 추출 실패")
+            cached = (
+                _load_cached_tables(self.config.scrape_type, bank_name, date_info)
+                if cacheable and self.use_cache else None
+            )
+            if cached:
+                result_data.update(cached)
+                self.logger.log_message(f"{bank_name} - 캐시 사용 ({date_info})")
+            else:
+                for category in self.config.CATEGORIES:
+                    if progress_callback:
+                        progress_callback(bank_name, f"{category} 처리 중")
+
+                    if self.select_category(driver, category):
+                        tables = self.extract_tables_from_page(driver)
+                        if tables:
+                            result_data[category] = tables
+                            self.logger.log_message(f"{bank_name} - {category}: {len(tables)}개 테이블")
+
+                # 모든 카테고리를 받아온 경우에만 캐시 (부분 결과가 굳어지지 않도록)
+                if cacheable and len(result_data) == len(self.config.CATEGORIES) + 1:
+                    _save_cached_tables(
+                        self.config.scrape_type, bank_name, date_info,
+                        {k: v for k, v in result_data.items() if k != '날짜정보'}
+                    )
 
             # Excel 파일 저장
             if len(result_data) > 1:
-                scrape_type_name = "분기공시" if self.config.scrape_type == "quarterly" else "결산공시"
                 # 파일명에 날짜 정보 포함
-                safe_date = date_info.replace('/', '_').replace(' ', '')
-                filename = f"{bank_name}_{scrape_type_name}_{safe_date}.xlsx"
+                filename = f"{bank_name}_{self._scrape_type_name}_{safe_date}.xlsx"
                 filepath = os.path.join(self.config.output_dir, filename)
 
-                with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+                # xlsxwriter constant_memory: 행을 위에서 아래로 쓰는 즉시 디스크로 흘려보내 셀 객체를 쌓지 않음
+                # 이미 내보낸 행에 쓰면 버려지므로 모든 시트는 행 단위로 쓰는 write_sheet로만 기록
+                # (to_excel은 컬럼 단위로 쓰므로 이 모드에서 사용하면 안 됨)
+                with pd.ExcelWriter(
+                    filepath, engine='xlsxwriter',
+                    engine_kwargs={'options': {'constant_memory': True}}
+                ) as writer:
                     # 날짜 정보 시트
-                    pd.DataFrame({
+                    write_sheet(writer, pd.DataFrame({
                         '은행명': [bank_name],
                         '공시일': [date_info],
-                        '스크래핑일시': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
-                    }).to_excel(writer, sheet_name='정보', index=False)
+                        '스크래핑일시': [extract_ts or datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+                    }), '정보')
 
                     for category, tables in result_data.items():
                         if category == '날짜정보':
@@ -490,7 +721,7 @@ class BankScraper:
                         for idx, df in enumerate(tables):
                             sheet_name = f"{category}_{idx+1}" if len(tables) > 1 else category
                             sheet_name = sheet_name[:31]  # Excel 시트명 길이 제한
-                            df.to_excel(writer, sheet_name=sheet_name, index=False)
+                            write_sheet(writer, df, sheet_name)
 
                 self.logger.log_message(f"[완료] {bank_name} 저장완료")
                 return filepath, True, date_info
@@ -499,51 +730,46 @@ class BankScraper:
 
         except Exception as e:
             self.logger.log_message(f"{bank_name} 스크래핑 오류: {str(e)}")
+            # 상태를 알 수 없는 드라이버는 다음 은행에 넘기지 않음
+            self._discard_driver()
             return None, False, date_info
-        finally:
-            if driver:
-                # user-data-dir 경로 보존 후 드라이버 종료
-                user_data_dir = None
-                for arg in driver.options.arguments:
-                    if arg.startswith('--user-data-dir='):
-                        user_data_dir = arg.split('=', 1)[1]
-                        break
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
-                # Chrome 임시 프로필 정리
-                if user_data_dir and os.path.exists(user_data_dir):
-                    import shutil
-                    try:
-                        shutil.rmtree(user_data_dir, ignore_errors=True)
-                    except Exception:
-                        pass
 
     def scrape_multiple_banks(self, banks, progress_callback=None):
-        """여러 은행 스크래핑"""
-        results = []
+        """여러 은행 스크래핑 (은행마다 별도 드라이버로 MAX_WORKERS개씩 병렬 처리)"""
         total = len(banks)
+        results = [None] * total
+        # 이번 실행의 모든 은행 파일에 같은 스크래핑 일시 기록
+        extract_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for idx, bank in enumerate(banks):
+        def _scrape_one(idx, bank):
             if progress_callback:
                 progress_callback(bank, f"처리 중 ({idx+1}/{total})")
 
-            filepath, success, date_info = self.scrape_bank(bank, progress_callback)
-            results.append({
+            filepath, success, date_info = self.scrape_bank(bank, progress_callback, extract_ts)
+            results[idx] = {
                 'bank': bank,
                 'success': success,
                 'filepath': filepath,
                 'date_info': date_info
-            })
+            }
 
             if progress_callback:
                 status = "완료" if success else "실패"
                 progress_callback(bank, status)
 
-            # 은행 간 딜레이
+            # 같은 워커가 연속으로 요청하지 않도록 은행 간 딜레이
             WaitUtils.wait_with_random(1, 2)
 
+        max_workers = max(1, min(self.config.MAX_WORKERS, total))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_scrape_one, idx, bank) for idx, bank in enumerate(banks)]
+                for future in as_completed(futures):
+                    future.result()
+        finally:
+            # 워커 스레드가 재사용하던 드라이버 정리
+            self.close()
+
         return results
 
     def create_zip_archive(self, results, custom_filename=None):
@@ -561,34 +787,49 @@ class BankScraper:
 
         zip_path = os.path.join(self.config.output_dir, zip_filename)
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # xlsx는 이미 ZIP 압축된 파일이므로 다시 deflate하지 않고 그대로 저장
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
             for filepath in successful_files:
-                if os.path.exists(filepath):
+                try:
                     zipf.write(filepath, os.path.basename(filepath))
+                except FileNotFoundError:
+                    # 저장 후 사라진 파일은 건너뜀 (미리 stat하지 않음)
+                    continue
 
-            # 통합 요약 파일 생성
+            # 통합 요약 파일 생성 (디스크를 거치지 않고 메모리에서 바로 추가)
             summary_df = create_summary_dataframe(results)
-            summary_path = os.path.join(self.config.output_dir, "스크래핑_요약.xlsx")
-            summary_df.to_excel(summary_path, index=False)
-            zipf.write(summary_path, "스크래핑_요약.xlsx")
+            buffer = io.BytesIO()
+            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+                write_sheet(writer, summary_df, 'Sheet1')
+            zipf.writestr("스크래핑_요약.xlsx", buffer.getvalue())
+            # 엑셀 없이도 바로 열 수 있는 CSV 요약 (Excel 한글 인식을 위해 BOM 포함)
+            zipf.writestr(
+                "스크래핑_요약.csv",
+                summary_df.to_csv(index=False).encode('utf-8-sig'),
+                compress_type=zipfile.ZIP_DEFLATED
+            )
 
         return zip_path
 
 
 def create_summary_dataframe(results, bank_dates=None):
     """스크래핑 결과 요약 DataFrame 생성 - 공시날짜 포함"""
-    summary_data = []
+    # 컬럼별 리스트로 모아 한 번에 생성 (행 dict마다 dtype 추론하지 않음)
+    banks, dates, statuses, files = [], [], [], []
     for r in results:
         # 날짜 정보 가져오기
         date_info = r.get('date_info', '')
         if not date_info and bank_dates:
             date_info = bank_dates.get(r['bank'], '')
 
-        summary_data.append({
-            '은행명': r['bank'],
-            '공시날짜': date_info if date_info else '-',
-            '상태': '✅ 성공' if r['success'] else '❌ 실패',
-            '파일명': os.path.basename(r['filepath']) if r['filepath'] else '-'
-        })
-
-    return pd.DataFrame(summary_data)
+        banks.append(r['bank'])
+        dates.append(date_info if date_info else '-')
+        statuses.append('✅ 성공' if r['success'] else '❌ 실패')
+        files.append(os.path.basename(r['filepath']) if r['filepath'] else '-')
+
+    return pd.DataFrame({
+        '은행명': banks,
+        '공시날짜': dates,
+        '상태': statuses,
+        '파일명': files
+    })
@@ -0,0 +1,104 @@
+import pdf_delinquency_extractor as pde
+
+
+_PAGE_TEXT = "자산건전성 지표\n연체대출비율(금액기준)\n1.23\n4.56\n"
+
+# text 전략으로 잡히는 (컬럼이 어긋난) 표: 정규식 결과와 다른 값을 담고 있음
+_MISALIGNED_TABLE = [
+    ["구분", "당기", "전기"],
+    ["연체대출비율(금액기준)", "9.99", "8.88"],
+]
+
+
+class _FakePage:
+    def __init__(self, edges, line_tables=None, text_tables=None, text=_PAGE_TEXT):
+        self.edges = edges
+        self._line_tables = line_tables or []
+        self._text_tables = text_tables or []
+        self._text = text
+        self.strategies = []
+
+    def extract_tables(self, table_settings=None):
+        strategy = table_settings["vertical_strategy"]
+        self.strategies.append(strategy)
+        return self._line_tables if strategy == "lines" else self._text_tables
+
+    def extract_text(self):
+        return self._text
+
+
+class _FakePdf:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakePdfplumber:
+    def __init__(self, pages):
+        self._pages = pages
+
+    def open(self, path):
+        return _FakePdf(self._pages)
+
+
+def test_edgeless_page_skips_table_extraction():
+    page = _FakePage(edges=[], text_tables=[_MISALIGNED_TABLE])
+
+    assert pde._search_delinquency_in_page(page) is None
+    assert page.strategies == []
+
+
+def test_ruled_page_without_line_tables_retries_text_strategy():
+    page = _FakePage(edges=[object()], text_tables=[_MISALIGNED_TABLE])
+
+    result = pde._search_delinquency_in_page(page)
+
+    assert page.strategies == ["lines", "text"]
+    assert result == {"연체율_당기": "9.99", "연체율_전기": "8.88"}
+
+
+def test_edgeless_page_uses_text_regex_over_text_table(monkeypatch):
+    page = _FakePage(edges=[], text_tables=[_MISALIGNED_TABLE])
+    monkeypatch.setattr(pde, "PDFPLUMBER_AVAILABLE", True)
+    monkeypatch.setattr(pde, "PDFIUM_AVAILABLE", False)
+    monkeypatch.setattr(pde, "pdfplumber", _FakePdfplumber([page]), raising=False)
+
+    result, method = pde._extract_delinquency_uncached("dummy.pdf", None)
+
+    assert result == {"연체율_당기": "1.23", "연체율_전기": "4.56"}
+    assert method == pde._CACHE_METHOD_FALLBACK
+    assert page.strategies == []
+
+
+_FULL_RESULT = {"연체율_당기": "1.23", "연체율_전기": "4.56"}
+
+
+def test_fallback_cache_is_replaced_when_gemini_is_enabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(pde, "_CACHE_DIR", str(tmp_path))
+    pde._save_cached_result("abc", _FULL_RESULT, pde._CACHE_METHOD_FALLBACK)
+
+    assert pde._load_cached_result("abc", gemini_enabled=False) == _FULL_RESULT
+    assert pde._load_cached_result("abc", gemini_enabled=True) is None
+
+
+def test_partial_gemini_cache_is_replaced_when_gemini_is_enabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(pde, "_CACHE_DIR", str(tmp_path))
+    pde._save_cached_result("abc", {"연체율_당기": "1.23"}, pde._CACHE_METHOD_GEMINI)
+    assert pde._load_cached_result("abc", gemini_enabled=True) is None
+
+    pde._save_cached_result("abc", _FULL_RESULT, pde._CACHE_METHOD_GEMINI)
+    assert pde._load_cached_result("abc", gemini_enabled=True) == _FULL_RESULT
+
+
+def test_cache_from_another_version_is_ignored(monkeypatch, tmp_path):
+    monkeypatch.setattr(pde, "_CACHE_DIR", str(tmp_path))
+    pde._save_cached_result("abc", _FULL_RESULT, pde._CACHE_METHOD_GEMINI)
+    monkeypatch.setattr(pde, "_CACHE_VERSION", pde._CACHE_VERSION + 1)
+
+    assert pde._load_cached_result("abc") is None
+